@@ -60,6 +60,13 @@ class BybitAPIConfig(BaseSettings):
     rate_limit_websocket: int = Field(
         default=1000, validation_alias="BYBIT_RATE_LIMIT_WEBSOCKET"
     )
+    # Route demo order entry through the v5 WebSocket trade stream
+    ws_order_entry: bool = Field(default=False, validation_alias="BYBIT_WS_ORDER_ENTRY")
+    # Requests a batch call may have in flight at once (ccxt's throttle
+    # queue rejects work beyond its maxCapacity)
+    max_concurrent_requests: int = Field(
+        default=200, validation_alias="BYBIT_MAX_CONCURRENT_REQUESTS"
+    )
 
     # DEMO API Keys (Testnet - Read/Write)
     demo_api_key: str = Field(default="", validation_alias="BYBIT_DEMO_API_KEY")
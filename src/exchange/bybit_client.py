@@ -10,21 +10,69 @@ subaccounts, one for each engine:
 """
 
 import asyncio
+import logging
 import time
-from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime
+from collections import OrderedDict
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Union
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple, Union
 
+import aiohttp
 import ccxt.async_support as ccxt
+import ccxt.pro as ccxtpro
+import numpy as np
+import orjson
 import structlog
 
+from src.core import config as core_config
 from src.core.config import engine_config, trading_config
-from src.core.models import (MarketData, Order, OrderSide, OrderStatus,
-                             OrderType, Portfolio, Position, PositionSide)
+from src.core.models import (
+    MarketData,
+    Order,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    Portfolio,
+    Position,
+    PositionSide,
+)
+from src.exchange.bybit_demo_http import BybitDemoAsyncHTTP
 
 logger = structlog.get_logger(__name__)
+# Stdlib logger behind `logger`; structlog's filter_by_level consults its level
+_std_logger = logging.getLogger(__name__)
+
+# Fallback spot quantity steps, used until market metadata has been loaded
+_BTC_PREC = Decimal("0.000001")
+_ETH_PREC = Decimal("0.00001")
+_DEFAULT_PRECISION = Decimal("0.0001")
+
+# Quantity step per (category, exchange symbol id), e.g. ("spot", "BTCUSDT"),
+# filled by PybitDemoClient.load_markets()
+_PRECISION_CACHE: Dict[Tuple[str, str], Decimal] = {}
+
+# Seconds a demo wallet snapshot is reused across clients
+_BALANCE_CACHE_TTL = 0.5
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _price_to_decimal(value: Union[float, int, str]) -> Decimal:
+    """Convert an exchange price to Decimal, memoized.
+
+    Neighbouring candles repeat the same tick-rounded prices, so most
+    conversions are cache hits. typed=True keeps 1 and 1.0 apart, since
+    their str() forms give Decimals with different exponents.
+    """
+    return Decimal(str(value))
+
+
+@lru_cache(maxsize=256)
+def _to_ccxt_symbol(symbol: str) -> str:
+    """Convert an exchange symbol id to ccxt format (BTCUSDT -> BTC/USDT)."""
+    return symbol if "/" in symbol else symbol.replace("USDT", "/USDT")
 
 
 class SubAccountType(str, Enum):
@@ -37,6 +85,32 @@ class SubAccountType(str, Enum):
     TACTICAL = "TACTICAL"
 
 
+# Market type, max leverage and read-only flag by subaccount purpose
+_SUBACCOUNT_PROFILES: Dict[SubAccountType, Tuple[str, float, bool]] = {
+    SubAccountType.MASTER: ("spot", 1.0, True),
+    SubAccountType.CORE_HODL: ("spot", 1.0, False),
+    SubAccountType.TREND: ("linear", 2.0, False),  # USDT perpetuals
+    SubAccountType.FUNDING: ("linear", 2.0, False),  # Uses both spot and linear
+    SubAccountType.TACTICAL: ("spot", 1.0, False),
+}
+_DEFAULT_PROFILE: Tuple[str, float, bool] = ("spot", 1.0, False)
+
+# Market types that trade contract positions rather than spot holdings
+_PERP_MARKETS = frozenset(("linear", "inverse"))
+
+
+class _BatchOrder(NamedTuple):
+    """A validated order waiting for a create-batch request."""
+
+    index: int  # Position of the spec in the caller's list
+    symbol: str
+    side: str
+    order_type: str
+    amount: Decimal
+    price: Optional[Decimal]
+    params: Dict[str, Any]
+
+
 class SubAccountConfig:
     """Configuration for a single subaccount."""
 
@@ -61,45 +135,28 @@ class SubAccountConfig:
     @classmethod
     def from_env(cls, subaccount_type: SubAccountType) -> "SubAccountConfig":
         """Create subaccount config from engine configuration."""
-        from src.core.config import engine_config
-
         # Get API credentials from engine_config (reads from .env file)
-        api_key = engine_config.bybit.active_api_key
-        api_secret = engine_config.bybit.active_api_secret
-
-        # Determine market type and leverage based on subaccount purpose
-        if subaccount_type == SubAccountType.MASTER:
-            default_market = "spot"
-            max_leverage = 1.0
-            is_read_only = True
-        elif subaccount_type == SubAccountType.CORE_HODL:
-            default_market = "spot"
-            max_leverage = 1.0
-            is_read_only = False
-        elif subaccount_type == SubAccountType.TREND:
-            default_market = "linear"  # USDT perpetuals
-            max_leverage = 2.0
-            is_read_only = False
-        elif subaccount_type == SubAccountType.FUNDING:
-            default_market = "linear"  # Uses both spot and linear
-            max_leverage = 2.0
-            is_read_only = False
-        elif subaccount_type == SubAccountType.TACTICAL:
-            default_market = "spot"
-            max_leverage = 1.0
-            is_read_only = False
-        else:
-            default_market = "spot"
-            max_leverage = 1.0
-            is_read_only = False
+        bybit = core_config.engine_config.bybit
+        return cls.from_profile(
+            subaccount_type, bybit.active_api_key, bybit.active_api_secret
+        )
+
+    @classmethod
+    def from_profile(
+        cls, subaccount_type: SubAccountType, api_key: str, api_secret: str
+    ) -> "SubAccountConfig":
+        """Create subaccount config from already-resolved API credentials."""
+        market, leverage, read_only = _SUBACCOUNT_PROFILES.get(
+            subaccount_type, _DEFAULT_PROFILE
+        )
 
         return cls(
             name=subaccount_type.value,
             api_key=api_key,
             api_secret=api_secret,
-            default_market=default_market,
-            max_leverage=max_leverage,
-            is_read_only=is_read_only,
+            default_market=market,
+            max_leverage=leverage,
+            is_read_only=read_only,
         )
 
 
@@ -110,69 +167,334 @@ class RetryConfig:
     DEFAULT_BASE_DELAY = 1.0  # seconds
     DEFAULT_MAX_DELAY = 30.0  # seconds
     DEFAULT_EXPONENTIAL_BASE = 2.0
+    MAX_RATE_LIMIT_WAIT = 300.0  # seconds, cap on server-requested waits
+
+
+class _BalanceCache:
+    """Wallet snapshots shared by the demo clients of one owner.
+
+    Demo subaccounts share one UNIFIED wallet per API key, so a snapshot is
+    reused across clients for _BALANCE_CACHE_TTL seconds. The owner (a
+    ByBitClient, or a standalone PybitDemoClient) lives on one event loop,
+    so its locks are never contended from another.
+    """
+
+    __slots__ = ("entries", "_locks")
+
+    def __init__(self):
+        # api_key -> (monotonic, balance)
+        self.entries: Dict[str, Tuple[float, Dict]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def lock(self, api_key: str) -> asyncio.Lock:
+        """Get the lock serialising wallet requests for an API key."""
+        lock = self._locks.get(api_key)
+        if lock is None:
+            lock = self._locks[api_key] = asyncio.Lock()
+        return lock
 
 
 class PybitDemoClient:
     """
-    Async wrapper for pybit HTTP client (Demo Trading mode).
+    Async client for Bybit Demo Trading.
 
-    Bybit Demo Trading requires pybit with demo=True parameter.
-    This wrapper runs sync pybit calls in thread pool executor.
+    Signed REST calls go through BybitDemoAsyncHTTP on the event loop;
+    pybit is only used for the optional WebSocket order-entry session.
     """
 
-    def __init__(self, api_key: str, api_secret: str):
-        from pybit.unified_trading import HTTP
+    # Bybit v5 order status -> ccxt order status
+    _STATUS_MAP = {
+        "Created": "open",
+        "New": "open",
+        "Rejected": "rejected",
+        "PartiallyFilled": "open",
+        "PartiallyFilledCanceled": "canceled",
+        "Filled": "closed",
+        "Cancelled": "canceled",
+        "Untriggered": "open",
+        "Triggered": "open",
+        "Deactivated": "canceled",
+    }
+
+    # Seconds to wait for a WebSocket order ack before falling back to HTTP
+    WS_ORDER_TIMEOUT = 5.0
+
+    # Orders arriving within this window share one batch-place request
+    ORDER_BATCH_WINDOW = 0.01
+    MAX_BATCH_ORDERS = 10
 
-        self._client = HTTP(
-            testnet=False,
-            demo=True,
+    # Connection pool for the public market-data session
+    MARKET_DATA_POOL_SIZE = 32
+    MARKET_DATA_DNS_TTL = 300
+    MARKET_DATA_KEEPALIVE = 60.0
+
+    # Recent OHLCV windows kept per client; each lives for half a bar
+    OHLCV_CACHE_SIZE = 128
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        use_ws_orders: bool = False,
+        balance_cache: Optional[_BalanceCache] = None,
+    ):
+        self._client = BybitDemoAsyncHTTP(
             api_key=api_key,
             api_secret=api_secret,
             recv_window=10000,  # 10 seconds to handle clock skew
         )
-        self._executor = ThreadPoolExecutor(max_workers=4)
         self.apiKey = api_key  # For compatibility
         self.secret = api_secret
 
         # Add options dict for compatibility with ccxt-style access
         self.options = {"defaultType": "spot"}
 
-    async def fetch_balance(self, params=None):
-        """Fetch wallet balance (async wrapper)."""
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            self._executor,
-            lambda: self._client.get_wallet_balance(accountType="UNIFIED"),
+        # Public ccxt exchange for market data, created on first use
+        self._market_exchange: Optional[ccxt.bybit] = None
+        self._market_session: Optional[aiohttp.ClientSession] = None
+
+        # WebSocket trade session for order entry, connected on first order
+        self._use_ws_orders = use_ws_orders
+        self._ws_trading = None
+
+        # Wallet snapshots, shared with the owner's other demo clients
+        self._balance_cache = (
+            balance_cache if balance_cache is not None else _BalanceCache()
+        )
+
+        # HTTP orders waiting for the batch window to close, by category
+        self._pending_orders: Dict[str, List[Tuple[Dict, asyncio.Future]]] = {}
+        # Running batch flushes, kept so close() can cancel them
+        self._flush_tasks: Set[asyncio.Task] = set()
+
+        # Whether this client has tried to fill _PRECISION_CACHE
+        self._precision_loaded = False
+
+        # (symbol, timeframe, limit) -> (expires_at, candles), oldest first
+        self._ohlcv_cache: OrderedDict[Tuple[str, str, int], Tuple[float, List]] = (
+            OrderedDict()
+        )
+
+    def _get_market_exchange(self) -> ccxt.bybit:
+        """Get the ccxt exchange used for public market data."""
+        if self._market_exchange is None:
+            # Pooled keep-alive session with cached DNS; ccxt leaves a
+            # caller-supplied session open, so close() owns it
+            connector = aiohttp.TCPConnector(
+                limit=self.MARKET_DATA_POOL_SIZE,
+                limit_per_host=self.MARKET_DATA_POOL_SIZE,
+                ttl_dns_cache=self.MARKET_DATA_DNS_TTL,
+                keepalive_timeout=self.MARKET_DATA_KEEPALIVE,
+            )
+            self._market_session = aiohttp.ClientSession(connector=connector)
+            self._market_exchange = ccxt.bybit(
+                {
+                    "enableRateLimit": True,
+                    "options": {"defaultType": "spot"},
+                    "session": self._market_session,
+                }
+            )
+            # ccxt still checks for a JSON body first; only the decode is swapped
+            self._market_exchange.on_json_response = orjson.loads
+        return self._market_exchange
+
+    async def _get_ws_trading(self):
+        """Get the WebSocket trade session, or None if it is unavailable."""
+        if not self._use_ws_orders:
+            return None
+        if self._ws_trading is None or not self._ws_trading.is_connected():
+            from pybit.unified_trading import WebSocketTrading
+
+            try:
+                # pybit connects and authenticates synchronously
+                self._ws_trading = await asyncio.to_thread(
+                    lambda: WebSocketTrading(
+                        testnet=False,
+                        demo=True,
+                        api_key=self.apiKey,
+                        api_secret=self.secret,
+                        recv_window=10000,
+                    ),
+                )
+            except Exception as e:
+                # Stay on HTTP for the rest of the session
+                logger.warning("pybit_demo.ws_trading_unavailable", error=str(e))
+                self._use_ws_orders = False
+                self._ws_trading = None
+        return self._ws_trading
+
+    async def _place_order_ws(self, ws_trading, order_params: Dict) -> Dict:
+        """Send order.create over the WebSocket trade stream.
+
+        Returns the response in the same shape as the HTTP place_order endpoint.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def on_response(message):
+            # Invoked on pybit's WebSocket thread
+            loop.call_soon_threadsafe(
+                lambda: future.done() or future.set_result(message)
+            )
+
+        ws_trading.place_order(
+            callback=on_response, error_callback=on_response, **order_params
         )
-        return self._convert_balance(result)
+        message = await asyncio.wait_for(future, timeout=self.WS_ORDER_TIMEOUT)
+        return {
+            "retCode": message.get("retCode"),
+            "retMsg": message.get("retMsg"),
+            "result": message.get("data") or {},
+        }
+
+    async def _place_order(self, order_params: Dict) -> Dict:
+        """Place an order over WebSocket when enabled, otherwise batched over HTTP."""
+        ws_trading = await self._get_ws_trading()
+        if ws_trading is not None:
+            try:
+                return await self._place_order_ws(ws_trading, order_params)
+            except asyncio.TimeoutError:
+                # No ack means the order may still be live, so resending
+                # over HTTP could double-fill
+                raise
+            except Exception as e:
+                logger.warning(
+                    "pybit_demo.ws_order_fallback",
+                    symbol=order_params.get("symbol"),
+                    error=str(e),
+                )
+
+        # Queue for the next batch; the first order in a category opens the window
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        category = order_params["category"]
+        pending = self._pending_orders.setdefault(category, [])
+        pending.append((order_params, future))
+        if len(pending) == 1:
+            task = loop.create_task(self._flush_orders(category))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        return await future
+
+    async def _flush_orders(self, category: str):
+        """Submit orders queued during the batch window for a category."""
+        await asyncio.sleep(self.ORDER_BATCH_WINDOW)
+        pending = self._pending_orders.pop(category, [])
+
+        try:
+            for start in range(0, len(pending), self.MAX_BATCH_ORDERS):
+                chunk = pending[start : start + self.MAX_BATCH_ORDERS]
+                try:
+                    results = await self._submit_orders(category, chunk)
+                except Exception as e:
+                    for _, future in chunk:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+
+                for (_, future), result in zip(chunk, results):
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            # Cancelled by close(): callers must not wait on orders never sent
+            self._fail_pending(pending)
+
+    @staticmethod
+    def _fail_pending(pending: List[Tuple[Dict, asyncio.Future]]):
+        """Fail queued orders whose batch will never be submitted."""
+        for order_params, future in pending:
+            if not future.done():
+                future.set_exception(
+                    RuntimeError(
+                        f"Client closed before order for "
+                        f"{order_params.get('symbol')} was sent"
+                    )
+                )
+
+    async def _submit_orders(
+        self, category: str, chunk: List[Tuple[Dict, asyncio.Future]]
+    ) -> List[Dict]:
+        """Place queued orders over HTTP, batching when there is more than one.
+
+        Returns one place_order-shaped response per order.
+        """
+        if len(chunk) == 1:
+            return [await self._client.place_order(**chunk[0][0])]
+
+        request = [
+            {k: v for k, v in order_params.items() if k != "category"}
+            for order_params, _ in chunk
+        ]
+        result = await self._client.place_batch_order(
+            category=category, request=request
+        )
+        if result.get("retCode") != 0:
+            return [result] * len(chunk)
+
+        # Per-order outcomes are split across result.list and retExtInfo.list
+        orders = (result.get("result") or {}).get("list") or []
+        statuses = (result.get("retExtInfo") or {}).get("list") or []
+        results = []
+        for i in range(len(chunk)):
+            status = statuses[i] if i < len(statuses) else {}
+            results.append(
+                {
+                    "retCode": status.get("code", 0),
+                    "retMsg": status.get("msg", "OK"),
+                    "result": orders[i] if i < len(orders) else {},
+                }
+            )
+        return results
+
+    async def fetch_balance(self, params=None):
+        """Fetch wallet balance (async wrapper).
+
+        Concurrent callers with the same API key and balance cache wait on
+        one request, and the result is reused for _BALANCE_CACHE_TTL
+        seconds. The returned dict is shared and must be treated as
+        read-only.
+        """
+        balances = self._balance_cache
+        async with balances.lock(self.apiKey):
+            cached = balances.entries.get(self.apiKey)
+            if cached is not None and time.monotonic() - cached[0] < _BALANCE_CACHE_TTL:
+                return cached[1]
+
+            result = await self._client.get_wallet_balance(accountType="UNIFIED")
+            balance = self._convert_balance(result)
+            if result.get("retCode") == 0:
+                balances.entries[self.apiKey] = (time.monotonic(), balance)
+            return balance
 
     def _convert_balance(self, result):
-        """Convert pybit response to ccxt-like format."""
+        """Convert wallet-balance response to ccxt-like format."""
         balances = {"info": result, "free": {}, "used": {}, "total": {}}
 
-        if result.get("retCode") == 0:
-            for account in result.get("result", {}).get("list", []):
-                for coin_data in account.get("coin", []):
-                    coin = coin_data.get("coin", "")
-                    if not coin:
-                        continue
-
-                    # Handle empty strings and None values
-                    wallet_str = coin_data.get("walletBalance", "0") or "0"
-                    free_str = coin_data.get("availableToWithdraw", "") or wallet_str
-
-                    try:
-                        wallet = float(wallet_str)
-                        free = float(free_str) if free_str else wallet
-                    except (ValueError, TypeError):
-                        wallet = 0.0
-                        free = 0.0
-
-                    # Only include coins with non-zero balance
-                    if wallet > 0 or free > 0:
-                        balances["total"][coin] = wallet
-                        balances["free"][coin] = free
-                        balances["used"][coin] = max(0, wallet - free)
+        if result.get("retCode") != 0:
+            return balances
+
+        total, free, used = balances["total"], balances["free"], balances["used"]
+        for account in result.get("result", {}).get("list", []):
+            for coin_data in account.get("coin", []):
+                coin = coin_data.get("coin")
+                if not coin:
+                    continue
+
+                # Handle empty strings and None values; free defaults to wallet
+                wallet_str = coin_data.get("walletBalance") or "0"
+                try:
+                    wallet = float(wallet_str)
+                    available = float(
+                        coin_data.get("availableToWithdraw") or wallet_str
+                    )
+                except (ValueError, TypeError):
+                    continue
+
+                # Only include coins with non-zero balance
+                if wallet > 0 or available > 0:
+                    total[coin] = wallet
+                    free[coin] = available
+                    used[coin] = max(0, wallet - available)
 
         return balances
 
@@ -184,20 +506,34 @@ class PybitDemoClient:
 
         This is needed for strategy analysis. We use ccxt for market data
         since pybit doesn't provide OHLCV in the same format.
+
+        Repeated requests for the same window within half a bar are served
+        from memory; the returned list is shared and must not be mutated.
         """
-        # Create a temporary ccxt exchange for market data only
-        if not hasattr(self, "_market_exchange"):
-            self._market_exchange = ccxt.bybit(
-                {"enableRateLimit": True, "options": {"defaultType": "spot"}}
-            )
+        key = (symbol, timeframe, limit)
+        if not params:
+            cached = self._ohlcv_cache.get(key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    self._ohlcv_cache.move_to_end(key)
+                    return cached[1]
+                del self._ohlcv_cache[key]
+
+        # Use a dedicated ccxt exchange for market data only
+        market_exchange = self._get_market_exchange()
 
         # Convert symbol format if needed (BTCUSDT -> BTC/USDT)
-        ccxt_symbol = symbol.replace("USDT", "/USDT") if "/" not in symbol else symbol
+        ccxt_symbol = _to_ccxt_symbol(symbol)
 
         try:
-            ohlcv = await self._market_exchange.fetch_ohlcv(
+            ohlcv = await market_exchange.fetch_ohlcv(
                 ccxt_symbol, timeframe=timeframe, limit=limit, params=params or {}
             )
+            if ohlcv and not params:
+                ttl = ccxt.Exchange.parse_timeframe(timeframe) / 2
+                self._ohlcv_cache[key] = (time.monotonic() + ttl, ohlcv)
+                if len(self._ohlcv_cache) > self.OHLCV_CACHE_SIZE:
+                    self._ohlcv_cache.popitem(last=False)
             return ohlcv
         except Exception as e:
             logger.warning("pybit_demo.ohlcv_error", symbol=symbol, error=str(e))
@@ -205,15 +541,12 @@ class PybitDemoClient:
 
     async def fetch_ticker(self, symbol: str, params=None):
         """Fetch ticker data using ccxt."""
-        if not hasattr(self, "_market_exchange"):
-            self._market_exchange = ccxt.bybit(
-                {"enableRateLimit": True, "options": {"defaultType": "spot"}}
-            )
+        market_exchange = self._get_market_exchange()
 
-        ccxt_symbol = symbol.replace("USDT", "/USDT") if "/" not in symbol else symbol
+        ccxt_symbol = _to_ccxt_symbol(symbol)
 
         try:
-            ticker = await self._market_exchange.fetch_ticker(
+            ticker = await market_exchange.fetch_ticker(
                 ccxt_symbol, params=params or {}
             )
             return ticker
@@ -221,6 +554,13 @@ class PybitDemoClient:
             logger.warning("pybit_demo.ticker_error", symbol=symbol, error=str(e))
             return {}
 
+    async def fetch_tickers(self, symbols: Optional[List[str]] = None, params=None):
+        """Fetch tickers for several symbols in one request using ccxt."""
+        market_exchange = self._get_market_exchange()
+
+        ccxt_symbols = [_to_ccxt_symbol(s) for s in symbols] if symbols else None
+        return await market_exchange.fetch_tickers(ccxt_symbols, params=params or {})
+
     async def create_order(
         self,
         symbol: str,
@@ -232,10 +572,13 @@ class PybitDemoClient:
         params=None,
         **kwargs,
     ):
-        """Create a real order on Bybit Demo Trading using pybit.
+        """Create a real order on Bybit Demo Trading.
 
         This method accepts both ccxt-style parameters (symbol, type, side, amount) and
         our internal parameter names (order_type).
+
+        Spot market buys are sized in quote currency from the current price.
+        Pass params['mark_price'] (or price) to skip the ticker round-trip.
         """
         from decimal import Decimal
 
@@ -245,8 +588,10 @@ class PybitDemoClient:
         if order_type is None and type is not None:
             order_type = type
 
-        # Handle amount as various types
-        if isinstance(amount, (int, float)):
+        # Handle amount as various types (strings parse directly)
+        if isinstance(amount, str):
+            amount = Decimal(amount)
+        elif isinstance(amount, (int, float)):
             amount = Decimal(str(amount))
         elif amount is None:
             amount = Decimal("0")
@@ -255,7 +600,6 @@ class PybitDemoClient:
         if price is not None and not isinstance(price, Decimal):
             price = Decimal(str(price)) if price else None
 
-        loop = asyncio.get_event_loop()
         params = params or {}
 
         # Convert symbol format for Bybit API (BTCUSDT -> BTCUSDT, but need to handle category)
@@ -289,9 +633,22 @@ class PybitDemoClient:
         # For spot market BUY orders, use quote amount (USDT) directly
         # This avoids precision issues with base quantity
         if category == "spot" and side_str == "BUY" and order_type_str == "MARKET":
-            # Get the USDT value from amount * price
-            ticker = await self.fetch_ticker(symbol)
-            current_price = Decimal(str(ticker.get("last", 0)))
+            # Get the USDT value from amount * price, using the caller's
+            # price hint when there is one
+            hint = params.get("mark_price") or price
+            if hint:
+                current_price = (
+                    hint if isinstance(hint, Decimal) else Decimal(str(hint))
+                )
+            else:
+                ticker = await self.fetch_ticker(symbol)
+                # Prefer Bybit's raw price string over ccxt's float to skip a round-trip
+                last = (
+                    (ticker.get("info") or {}).get("lastPrice")
+                    or ticker.get("last")
+                    or 0
+                )
+                current_price = Decimal(last if isinstance(last, str) else str(last))
             if current_price > 0:
                 quote_amount = (amount * current_price).quantize(Decimal("0.01"))
                 # Bybit minimum order value is 1 USDT, use at least 5 USDT to be safe
@@ -319,15 +676,16 @@ class PybitDemoClient:
                 qty_str = str(amount.quantize(Decimal("0.000001")))
                 order_params["qty"] = qty_str
         else:
-            # Round quantity to appropriate precision for the symbol
-            # Bybit spot precision: BTC=6, ETH=5, most others=4-6
-            if "BTC" in symbol:
-                qty_str = str(amount.quantize(Decimal("0.000001")))
-            elif "ETH" in symbol:
-                qty_str = str(amount.quantize(Decimal("0.00001")))
-            else:
-                qty_str = str(amount.quantize(Decimal("0.0001")))
-            order_params["qty"] = qty_str
+            # Round quantity to the symbol's step from market metadata, falling
+            # back to Bybit spot defaults (BTC=6, ETH=5, most others=4)
+            if not self._precision_loaded:
+                await self._load_precision()
+            quant = _PRECISION_CACHE.get((category, symbol)) or (
+                _BTC_PREC
+                if "BTC" in symbol
+                else _ETH_PREC if "ETH" in symbol else _DEFAULT_PRECISION
+            )
+            order_params["qty"] = str(amount.quantize(quant))
 
         # Add price for limit orders
         if price and order_type_str != "MARKET":
@@ -344,12 +702,12 @@ class PybitDemoClient:
         )
 
         try:
-            # Place the order using pybit
-            result = await loop.run_in_executor(
-                self._executor, lambda: self._client.place_order(**order_params)
-            )
+            # Place the order (WebSocket with HTTP fallback)
+            result = await self._place_order(order_params)
 
             if result.get("retCode") == 0:
+                # The fill moves the wallet, so the next read must go to Bybit
+                self._balance_cache.entries.pop(self.apiKey, None)
                 order_data = result.get("result", {})
                 logger.info(
                     "pybit_demo.order_placed",
@@ -387,14 +745,45 @@ class PybitDemoClient:
 
     async def load_markets(self):
         """Load markets using ccxt."""
-        if not hasattr(self, "_market_exchange"):
-            self._market_exchange = ccxt.bybit(
-                {"enableRateLimit": True, "options": {"defaultType": "spot"}}
-            )
-        return await self._market_exchange.load_markets()
+        markets = await self._get_market_exchange().load_markets()
+        self._precision_loaded = True
+
+        # Cache quantity steps so create_order avoids guessing per symbol
+        for market in markets.values():
+            if market.get("spot"):
+                category = "spot"
+            elif market.get("option"):
+                continue
+            elif market.get("linear"):
+                category = "linear"
+            elif market.get("inverse"):
+                category = "inverse"
+            else:
+                continue
+            step = (market.get("precision") or {}).get("amount")
+            if step and step < 1:
+                key = (category, market["id"])
+                _PRECISION_CACHE[key] = Decimal(str(step)).normalize()
+
+        return markets
+
+    async def _load_precision(self):
+        """Fill _PRECISION_CACHE on the first quantity-based order.
+
+        Demo subaccounts never load markets otherwise. The table is shared
+        by every client, so the load is skipped when another client has
+        filled it; a failed load is not retried and leaves the defaults.
+        """
+        self._precision_loaded = True
+        if _PRECISION_CACHE:
+            return
+        try:
+            await self.load_markets()
+        except Exception as e:
+            logger.warning("pybit_demo.precision_load_failed", error=str(e))
 
     async def fetch_order(self, order_id: str, symbol: str, params=None):
-        """Fetch order status using pybit.
+        """Fetch order status from Bybit Demo Trading.
 
         Args:
             order_id: The exchange order ID
@@ -404,17 +793,12 @@ class PybitDemoClient:
         Returns:
             Order info in ccxt-like format
         """
-        loop = asyncio.get_event_loop()
-
         # Determine category from symbol or params
         category = params.get("category", "spot") if params else "spot"
 
         try:
-            result = await loop.run_in_executor(
-                self._executor,
-                lambda: self._client.get_order_history(
-                    category=category, symbol=symbol, orderId=order_id
-                ),
+            result = await self._client.get_order_history(
+                category=category, symbol=symbol, orderId=order_id
             )
 
             if result.get("retCode") == 0:
@@ -460,35 +844,18 @@ class PybitDemoClient:
 
     def _map_order_status(self, status: str) -> str:
         """Map Bybit order status to ccxt format."""
-        status_map = {
-            "Created": "open",
-            "New": "open",
-            "Rejected": "rejected",
-            "PartiallyFilled": "open",
-            "PartiallyFilledCanceled": "canceled",
-            "Filled": "closed",
-            "Cancelled": "canceled",
-            "Untriggered": "open",
-            "Triggered": "open",
-            "Deactivated": "canceled",
-        }
-        return status_map.get(status, "unknown")
+        return self._STATUS_MAP.get(status, "unknown")
 
     async def fetch_open_orders(self, symbol: str = None, params=None):
-        """Fetch open orders (async wrapper for pybit)."""
-        loop = asyncio.get_event_loop()
-        
+        """Fetch open orders from Bybit Demo Trading."""
         try:
             # Build parameters
             request_params = {"category": "spot"}
             if symbol:
                 request_params["symbol"] = symbol
-                
-            result = await loop.run_in_executor(
-                self._executor,
-                lambda: self._client.get_open_orders(**request_params),
-            )
-            
+
+            result = await self._client.get_open_orders(**request_params)
+
             if result.get("retCode") == 0:
                 orders = result.get("result", {}).get("list", [])
                 # Convert to ccxt-like format
@@ -509,14 +876,84 @@ class PybitDemoClient:
                 ]
             return []
         except Exception as e:
-            logger.warning("pybit_demo.fetch_open_orders_error", symbol=symbol, error=str(e))
+            logger.warning(
+                "pybit_demo.fetch_open_orders_error", symbol=symbol, error=str(e)
+            )
             return []
 
     async def close(self):
-        """Close the client."""
-        if hasattr(self, "_market_exchange"):
+        """Close the client, failing any orders still waiting for a batch."""
+        flush_tasks = list(self._flush_tasks)
+        for task in flush_tasks:
+            task.cancel()
+        await asyncio.gather(*flush_tasks, return_exceptions=True)
+        for pending in self._pending_orders.values():
+            self._fail_pending(pending)
+        self._pending_orders.clear()
+
+        if self._market_exchange is not None:
             await self._market_exchange.close()
-        self._executor.shutdown(wait=False)
+        if self._market_session is not None:
+            await self._market_session.close()
+        if self._ws_trading is not None:
+            self._ws_trading.exit()
+        await self._client.close()
+
+
+def _retry_after_from_headers(headers: Optional[Dict[str, Any]]) -> Optional[float]:
+    """Seconds until the rate limit resets, from Retry-After or Bybit's
+    X-Bapi-Limit-Reset-Timestamp (ms epoch) header.
+
+    Returns None if neither header is present or the reset is not in the
+    future; Bybit sends the reset timestamp on every response, so a stale
+    one says nothing about the current limit.
+    """
+    if not headers:
+        return None
+    lowered = {key.lower(): value for key, value in headers.items()}
+    wait = None
+    retry_after = lowered.get("retry-after")
+    if retry_after is not None:
+        try:
+            wait = float(retry_after)
+        except (TypeError, ValueError):
+            pass  # HTTP-date form, fall through to the Bybit header
+    reset_ms = lowered.get("x-bapi-limit-reset-timestamp")
+    if wait is None and reset_ms is not None:
+        try:
+            wait = int(reset_ms) / 1000 - time.time()
+        except (TypeError, ValueError):
+            pass
+    return wait if wait is not None and wait > 0 else None
+
+
+def _rate_limit_retry_after(
+    error: Exception, args: tuple, kwargs: Dict[str, Any]
+) -> Optional[float]:
+    """Find the server-requested wait for a rate-limit error.
+
+    Uses ``error.retry_after`` when set, otherwise the last response headers
+    of the exchange that made the call: a ccxt exchange passed as an
+    argument, or the subaccount exchange of a ByBitClient method. Returns
+    None when there is no positive wait to honour.
+    """
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is not None:
+        return retry_after if retry_after > 0 else None
+
+    exchange = None
+    for arg in chain(args, kwargs.values()):
+        if isinstance(arg, ccxt.Exchange):
+            exchange = arg
+            break
+    if exchange is None and args and isinstance(args[0], ByBitClient):
+        # Decorated client methods take the subaccount as first argument
+        subaccount = kwargs.get("subaccount", args[1] if len(args) > 1 else None)
+        if isinstance(subaccount, str):
+            exchange = args[0].exchanges.get(subaccount)
+    if not isinstance(exchange, ccxt.Exchange):
+        return None
+    return _retry_after_from_headers(exchange.last_response_headers)
 
 
 def with_retry(
@@ -532,6 +969,10 @@ def with_retry(
 ):
     """Decorator for adding retry logic with exponential backoff.
 
+    Rate-limit errors (ccxt.RateLimitExceeded, ccxt.DDoSProtection) wait
+    for the reset reported in the Retry-After or X-Bapi-Limit-Reset-Timestamp
+    response header when one is available.
+
     Args:
         max_retries: Maximum number of retry attempts
         base_delay: Initial delay between retries in seconds
@@ -541,43 +982,61 @@ def with_retry(
     """
 
     def decorator(func):
+        # Event names are fixed per function, so build them once here
+        retry_event = f"{func.__name__}.retry_attempt"
+        rate_limit_event = f"{func.__name__}.rate_limit_hit"
+        exhausted_event = f"{func.__name__}.max_retries_exceeded"
+        # The backoff schedule only depends on the attempt number
+        delays = [
+            min(base_delay * (exponential_base**attempt), max_delay)
+            for attempt in range(max_retries)
+        ]
+
         async def wrapper(*args, **kwargs):
             last_exception = None
 
             for attempt in range(max_retries + 1):
                 try:
                     return await func(*args, **kwargs)
-                except retryable_exceptions as e:
+                except (ccxt.RateLimitExceeded, ccxt.DDoSProtection) as e:
+                    # Caught ahead of NetworkError, their base class: wait for
+                    # the reset the server reports, else use normal backoff
                     last_exception = e
                     if attempt < max_retries:
-                        delay = min(base_delay * (exponential_base**attempt), max_delay)
-                        logger.warning(
-                            f"{func.__name__}.retry_attempt",
-                            attempt=attempt + 1,
-                            max_retries=max_retries,
-                            delay=delay,
-                            error=str(e),
-                        )
+                        retry_after = _rate_limit_retry_after(e, args, kwargs)
+                        if retry_after is None:
+                            delay = delays[attempt]
+                        else:
+                            delay = min(retry_after, RetryConfig.MAX_RATE_LIMIT_WAIT)
+                        if _std_logger.isEnabledFor(logging.WARNING):
+                            logger.warning(
+                                rate_limit_event,
+                                attempt=attempt + 1,
+                                delay=delay,
+                                error=str(e),
+                            )
                         await asyncio.sleep(delay)
                     else:
                         break
-                except ccxt.RateLimitExceeded as e:
-                    # Special handling for rate limits - always retry with longer delay
+                except retryable_exceptions as e:
                     last_exception = e
                     if attempt < max_retries:
-                        delay = min(60.0 * (2**attempt), 300.0)  # Max 5 minutes
-                        logger.warning(
-                            f"{func.__name__}.rate_limit_hit",
-                            attempt=attempt + 1,
-                            delay=delay,
-                        )
+                        delay = delays[attempt]
+                        if _std_logger.isEnabledFor(logging.WARNING):
+                            logger.warning(
+                                retry_event,
+                                attempt=attempt + 1,
+                                max_retries=max_retries,
+                                delay=delay,
+                                error=str(e),
+                            )
                         await asyncio.sleep(delay)
                     else:
                         break
 
             # All retries exhausted
             logger.error(
-                f"{func.__name__}.max_retries_exceeded",
+                exhausted_event,
                 max_retries=max_retries,
                 last_error=str(last_exception),
             )
@@ -607,14 +1066,77 @@ class ByBitClient:
         SubAccountType.FUNDING: ["spot", "linear"]  # FUNDING uses both
     }
 
+    # Maximum subaccounts connecting concurrently during initialize()
+    MAX_CONCURRENT_INITS = 4
+
+    # Orders per /v5/order/create-batch request, by market type
+    MAX_BATCH_ORDERS = {"spot": 10, "linear": 20, "inverse": 20}
+
+    # Seconds before shared markets metadata is reloaded from the exchange
+    MARKETS_CACHE_TTL = 86400.0
+    # Markets are also persisted here so a restart can skip the reload;
+    # anchored to the project root, not the working directory
+    MARKETS_DISK_CACHE_DIR = Path(__file__).resolve().parents[2] / "data" / "cache"
+    # One HTTP connection pool shared by every subaccount's ccxt exchange
+    HTTP_POOL_SIZE = 200
+    HTTP_POOL_PER_HOST = 50
+    HTTP_DNS_TTL = 300
+    # Seconds an idle keep-alive connection is held for reuse
+    HTTP_KEEPALIVE = 60.0
+
+    # Streamed tickers older than this fall back to REST
+    TICKER_MAX_AGE = 5.0
+    # Pause before re-watching a WebSocket stream that errored
+    STREAM_RETRY_DELAY = 1.0
+    # Seconds a streamed open-order book is trusted before a REST resync
+    OPEN_ORDERS_RESYNC = 60.0
+
+    # Statuses that keep an order in the streamed open-order book
+    _OPEN_STATUSES = frozenset((OrderStatus.OPEN, OrderStatus.PARTIALLY_FILLED))
+
+    # Lowercased ccxt / Bybit order status -> internal OrderStatus
+    _ORDER_STATUS_MAP = {
+        "open": OrderStatus.OPEN,
+        "new": OrderStatus.OPEN,
+        "partially_filled": OrderStatus.PARTIALLY_FILLED,
+        "closed": OrderStatus.FILLED,
+        "filled": OrderStatus.FILLED,
+        "canceled": OrderStatus.CANCELLED,
+        "cancelled": OrderStatus.CANCELLED,
+        "pending": OrderStatus.PENDING,
+        "rejected": OrderStatus.REJECTED,
+        "expired": OrderStatus.EXPIRED,
+    }
+
     def __init__(self):
         self.exchanges: Dict[str, ccxt.bybit] = {}
         self.configs: Dict[str, SubAccountConfig] = {}
         self._initialized = False
         self._ws_connected = False
+        # Trading mode, pinned again at initialize()
+        self._paper = trading_config.trading_mode == "paper"
         self._price_callbacks: List[Callable[[str, Decimal], Any]] = []
         self._order_callbacks: List[Callable[[Order], Any]] = []
         self._markets_loaded: Dict[str, bool] = {}
+        # (exchange_id, environment) -> (loaded_at, markets), shared by subaccounts
+        self._markets_cache: Dict[Tuple[str, str], Tuple[float, Dict]] = {}
+        self._markets_lock = asyncio.Lock()
+        # Wallet snapshots shared by this client's demo subaccounts
+        self._demo_balances = _BalanceCache()
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        # Ticker stream: symbol -> (received_at monotonic, ccxt ticker)
+        self._ws_exchange: Optional[ccxtpro.bybit] = None
+        self._ticker_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._ticker_tasks: Dict[str, asyncio.Task] = {}
+        # Bounds batch fan-out; sized from config on first use
+        self._request_semaphore: Optional[asyncio.Semaphore] = None
+        # Order stream per subaccount, feeding the order callbacks
+        self._order_streams: Dict[str, ccxtpro.bybit] = {}
+        self._order_tasks: Dict[str, asyncio.Task] = {}
+        # Open orders kept current by the order stream:
+        # subaccount -> exchange order id -> Order, plus last REST resync time
+        self._open_orders: Dict[str, Dict[str, Order]] = {}
+        self._open_orders_synced: Dict[str, float] = {}
 
     async def initialize(
         self,
@@ -626,26 +1148,39 @@ class ByBitClient:
         Args:
             subaccounts: List of subaccounts to initialize. If None, initializes all.
             testnet: Whether to use testnet. If None, reads from BYBIT_TESTNET env var.
-        """
-        import os
 
+        Raises:
+            Exception: The first subaccount error, if every subaccount that was
+                attempted failed to initialize
+        """
         # Use the value from engine_config (which reads from .env properly)
-        from src.core.config import engine_config
+        bybit = core_config.engine_config.bybit
 
         if testnet is None:
-            testnet = engine_config.bybit.testnet
+            testnet = bybit.testnet
 
         if subaccounts is None:
             subaccounts = list(SubAccountType)
 
-        init_tasks = []
-        for subaccount_type in subaccounts:
-            task = self._initialize_subaccount(subaccount_type, testnet)
-            init_tasks.append(task)
+        self._paper = trading_config.trading_mode == "paper"
+
+        # Every subaccount shares the active key pair, so resolve it once
+        credentials = (bybit.active_api_key, bybit.active_api_secret)
 
-        results = await asyncio.gather(*init_tasks, return_exceptions=True)
+        # Bound concurrent connection setup (TLS handshakes, market loads)
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_INITS)
 
-        # Check for exceptions - re-raise the first one
+        async def initialize_limited(subaccount_type: SubAccountType):
+            async with semaphore:
+                await self._initialize_subaccount(subaccount_type, testnet, credentials)
+
+        results = await asyncio.gather(
+            *(initialize_limited(s) for s in subaccounts), return_exceptions=True
+        )
+
+        # Keep the subaccounts that came up; one failing subaccount must not
+        # take the others down with it
+        failures = []
         for subaccount_type, result in zip(subaccounts, results):
             if isinstance(result, Exception):
                 logger.error(
@@ -654,8 +1189,12 @@ class ByBitClient:
                     error=str(result),
                     error_type=type(result).__name__,
                 )
-                # Re-raise the original exception to preserve error type
-                raise result
+                failures.append(result)
+
+        # Re-raise the original exception (preserving its type) only if
+        # nothing could be initialized
+        if failures and not self.exchanges:
+            raise failures[0]
 
         self._initialized = True
 
@@ -663,15 +1202,29 @@ class ByBitClient:
             "bybit_client.initialized",
             subaccounts=[s.value for s in subaccounts],
             initialized=list(self.exchanges.keys()),
+            failed=len(failures),
             testnet=testnet,
             trading_mode=trading_config.trading_mode,
         )
 
     async def _initialize_subaccount(
-        self, subaccount_type: SubAccountType, testnet: bool
+        self,
+        subaccount_type: SubAccountType,
+        testnet: bool,
+        credentials: Optional[Tuple[str, str]] = None,
     ):
-        """Initialize a single subaccount connection."""
-        config = SubAccountConfig.from_env(subaccount_type)
+        """Initialize a single subaccount connection.
+
+        Args:
+            subaccount_type: Subaccount to connect
+            testnet: Whether to use testnet
+            credentials: Pre-resolved (api_key, api_secret); read from
+                engine_config when omitted
+        """
+        if credentials is None:
+            config = SubAccountConfig.from_env(subaccount_type)
+        else:
+            config = SubAccountConfig.from_profile(subaccount_type, *credentials)
 
         if not config.api_key or not config.api_secret:
             logger.warning(
@@ -685,7 +1238,7 @@ class ByBitClient:
         is_demo_trading = engine_config.bybit.api_mode == "demo" and not testnet
 
         if is_demo_trading:
-            # Use pybit for demo trading (required by Bybit)
+            # Use the demo client (Demo Trading has its own host)
             await self._initialize_demo_subaccount(subaccount_type, config)
         else:
             # Use ccxt for testnet and production
@@ -694,12 +1247,15 @@ class ByBitClient:
     async def _initialize_demo_subaccount(
         self, subaccount_type: SubAccountType, config: SubAccountConfig
     ):
-        """Initialize subaccount using pybit for Demo Trading."""
-        try:
-            exchange = PybitDemoClient(
-                api_key=config.api_key, api_secret=config.api_secret
-            )
+        """Initialize subaccount using PybitDemoClient for Demo Trading."""
+        exchange = PybitDemoClient(
+            api_key=config.api_key,
+            api_secret=config.api_secret,
+            use_ws_orders=core_config.engine_config.bybit.ws_order_entry,
+            balance_cache=self._demo_balances,
+        )
 
+        try:
             # Test connection by fetching balance
             await exchange.fetch_balance()
 
@@ -715,6 +1271,12 @@ class ByBitClient:
                 mode="demo_trading",
             )
         except Exception as e:
+            # Close the client to prevent executor/session leaks
+            try:
+                await exchange.close()
+            except Exception:
+                pass
+
             logger.error(
                 "bybit_client.subaccount_init_failed",
                 subaccount=subaccount_type.value,
@@ -737,6 +1299,8 @@ class ByBitClient:
                 "adjustForTimeDifference": True,
                 "recvWindow": 20000,
             },
+            # Reuse pooled TLS connections across subaccounts
+            "session": self._get_http_session(),
         }
 
         # Add subaccount ID if provided
@@ -744,10 +1308,11 @@ class ByBitClient:
             ccxt_config["options"]["subaccountId"] = config.subaccount_id
 
         exchange = ccxt.bybit(ccxt_config)
+        exchange.on_json_response = orjson.loads  # C decoder for large responses
 
         try:
-            # Load markets
-            await exchange.load_markets()
+            # Load markets (shared with subaccounts already connected)
+            await self._get_markets(exchange)
             self.exchanges[subaccount_type.value] = exchange
             self.configs[subaccount_type.value] = config
             self._markets_loaded[subaccount_type.value] = True
@@ -774,14 +1339,110 @@ class ByBitClient:
             )
             raise
 
+    async def _get_markets(self, exchange: ccxt.bybit) -> Dict[str, Any]:
+        """Get markets metadata, loading it at most once per MARKETS_CACHE_TTL.
+
+        Every ccxt subaccount talks to the same venue, and ccxt's bybit
+        load_markets fetches every category (spot, linear, inverse, option)
+        whatever the exchange's default type, so the first load is handed
+        to the others instead of each fetching instruments-info. The first
+        load in a process tries the on-disk copy before the network.
+        """
+        key = self._markets_cache_key(exchange)
+        async with self._markets_lock:
+            cached = self._markets_cache.get(key)
+            if (
+                cached is not None
+                and time.monotonic() - cached[0] < self.MARKETS_CACHE_TTL
+            ):
+                if exchange.markets is not cached[1]:
+                    exchange.set_markets(cached[1])
+                return cached[1]
+
+            path = self._markets_cache_path(exchange)
+            if cached is None:
+                stored = await asyncio.to_thread(self._read_markets_file, path)
+                if stored is not None:
+                    exchange.set_markets(stored)
+                    self._markets_cache[key] = (time.monotonic(), exchange.markets)
+                    return exchange.markets
+
+            markets = await exchange.load_markets(reload=cached is not None)
+            self._markets_cache[key] = (time.monotonic(), markets)
+            await asyncio.to_thread(self._write_markets_file, path, markets)
+            return markets
+
+    async def _invalidate_markets(self, exchange: ccxt.bybit):
+        """Drop cached markets so the next lookup reloads them."""
+        self._markets_cache.pop(self._markets_cache_key(exchange), None)
+        path = self._markets_cache_path(exchange)
+        try:
+            await asyncio.to_thread(path.unlink, missing_ok=True)
+        except OSError as e:
+            logger.warning(
+                "bybit_client.markets_cache_delete_failed", path=str(path), error=str(e)
+            )
+
+    @staticmethod
+    def _markets_cache_key(exchange: ccxt.bybit) -> Tuple[str, str]:
+        """Markets are shared per venue and environment (testnet or mainnet)."""
+        sandbox = getattr(exchange, "isSandboxModeEnabled", False) is True
+        return exchange.id, "testnet" if sandbox else "mainnet"
+
+    def _markets_cache_path(self, exchange: ccxt.bybit) -> Path:
+        """On-disk markets file, separate for testnet and mainnet."""
+        exchange_id, env = self._markets_cache_key(exchange)
+        return self.MARKETS_DISK_CACHE_DIR / f"{exchange_id}_{env}_markets.json"
+
+    def _read_markets_file(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Load persisted markets if the file is younger than MARKETS_CACHE_TTL."""
+        try:
+            if time.time() - path.stat().st_mtime >= self.MARKETS_CACHE_TTL:
+                return None
+            return orjson.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _write_markets_file(self, path: Path, markets: Dict[str, Any]):
+        """Persist markets atomically; failures only cost the next restart."""
+        try:
+            data = orjson.dumps(markets)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(path)
+        except (OSError, TypeError) as e:
+            logger.warning(
+                "bybit_client.markets_cache_write_failed", path=str(path), error=str(e)
+            )
+
     async def close(self):
         """Close all exchange connections."""
+        stream_tasks = [*self._ticker_tasks.values(), *self._order_tasks.values()]
+        for task in stream_tasks:
+            task.cancel()
+        await asyncio.gather(*stream_tasks, return_exceptions=True)
+        self._ticker_tasks.clear()
+        self._order_tasks.clear()
+        self._ticker_cache.clear()
+        if self._ws_exchange is not None:
+            await self._close_exchange("ticker_stream", self._ws_exchange)
+            self._ws_exchange = None
+        for name, stream in self._order_streams.items():
+            await self._close_exchange(f"{name}_order_stream", stream)
+        self._order_streams.clear()
+        self._ws_connected = False
+
         close_tasks = []
         for name, exchange in self.exchanges.items():
             task = self._close_exchange(name, exchange)
             close_tasks.append(task)
 
         await asyncio.gather(*close_tasks, return_exceptions=True)
+        # The exchanges don't own the shared session, so close it once here
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
         self.exchanges.clear()
         self.configs.clear()
         self._initialized = False
@@ -796,20 +1457,35 @@ class ByBitClient:
         except Exception as e:
             logger.warning("bybit_client.close_error", subaccount=name, error=str(e))
 
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP session shared by the subaccount exchanges."""
+        if self._http_session is None or self._http_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.HTTP_POOL_SIZE,
+                limit_per_host=self.HTTP_POOL_PER_HOST,
+                ttl_dns_cache=self.HTTP_DNS_TTL,
+                keepalive_timeout=self.HTTP_KEEPALIVE,
+                enable_cleanup_closed=True,
+            )
+            self._http_session = aiohttp.ClientSession(connector=connector)
+        return self._http_session
+
     def _get_exchange(self, subaccount: str) -> ccxt.bybit:
         """Get exchange instance for a subaccount."""
-        if subaccount not in self.exchanges:
+        try:
+            return self.exchanges[subaccount]
+        except KeyError:
             raise ValueError(
                 f"Subaccount '{subaccount}' not initialized. "
                 f"Available: {list(self.exchanges.keys())}"
-            )
-        return self.exchanges[subaccount]
+            ) from None
 
     def _get_config(self, subaccount: str) -> SubAccountConfig:
         """Get configuration for a subaccount."""
-        if subaccount not in self.configs:
-            raise ValueError(f"Subaccount '{subaccount}' not configured")
-        return self.configs[subaccount]
+        try:
+            return self.configs[subaccount]
+        except KeyError:
+            raise ValueError(f"Subaccount '{subaccount}' not configured") from None
 
     @with_retry()
     async def get_balance(
@@ -846,13 +1522,14 @@ class ByBitClient:
                     if currency == asset:
                         total_portfolio_value += Decimal(str(amount))
 
-            logger.debug(
-                "bybit_client.balance_fetched",
-                subaccount=subaccount,
-                asset=asset,
-                total=str(total),
-                free=str(free),
-            )
+            if _std_logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "bybit_client.balance_fetched",
+                    subaccount=subaccount,
+                    asset=asset,
+                    total=str(total),
+                    free=str(free),
+                )
 
             return Portfolio(
                 total_balance=total_portfolio_value or total, available_balance=free
@@ -888,11 +1565,12 @@ class ByBitClient:
                 # ccxt exchange
                 balance = await exchange.fetch_balance()
 
-            logger.debug(
-                "bybit_client.raw_balance_fetched",
-                subaccount=subaccount,
-                coins=list(balance.get("total", {}).keys()),
-            )
+            if _std_logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "bybit_client.raw_balance_fetched",
+                    subaccount=subaccount,
+                    coins=list(balance.get("total", {}).keys()),
+                )
 
             return balance
 
@@ -927,64 +1605,67 @@ class ByBitClient:
 
         try:
             # For perpetual markets, fetch contract positions
-            if config.default_market in ["linear", "inverse"]:
+            if config.default_market in _PERP_MARKETS:
                 raw_positions = await exchange.fetch_positions(symbol)
 
+                to_position = self._position_from_ccxt
                 for pos in raw_positions:
-                    contracts = Decimal(str(pos.get("contracts", 0)))
-                    if contracts != 0:
-                        side = (
-                            PositionSide.LONG if contracts > 0 else PositionSide.SHORT
-                        )
-                        positions.append(
-                            Position(
-                                symbol=pos.get("symbol", symbol or ""),
-                                side=side,
-                                entry_price=Decimal(str(pos.get("entryPrice", 0))),
-                                amount=abs(contracts),
-                                unrealized_pnl=Decimal(
-                                    str(pos.get("unrealizedPnl", 0))
-                                ),
-                                realized_pnl=Decimal(str(pos.get("realizedPnl", 0))),
-                                metadata={
-                                    "leverage": pos.get("leverage", 1),
-                                    "marginMode": pos.get("marginMode", "cross"),
-                                    "liquidationPrice": pos.get("liquidationPrice"),
-                                },
-                            )
-                        )
+                    position = to_position(pos, symbol)
+                    if position is not None:
+                        positions.append(position)
 
             # For spot markets, build positions from balance
             else:
                 balance = await exchange.fetch_balance()
 
-                for currency, amount in balance.get("total", {}).items():
-                    if currency != "USDT" and amount and amount > 0:
-                        pair_symbol = f"{currency}/USDT"
+                holdings = [
+                    (f"{currency}/USDT", amount)
+                    for currency, amount in balance.get("total", {}).items()
+                    if currency != "USDT" and amount and amount > 0
+                ]
+
+                if holdings:
+                    # Streamed tickers first, then one request for the rest
+                    tickers = {}
+                    missing = []
+                    for pair_symbol, _ in holdings:
+                        ticker = self._cached_ticker(pair_symbol.replace("/", ""))
+                        if ticker is None:
+                            missing.append(pair_symbol)
+                        else:
+                            tickers[pair_symbol] = ticker
+                    if missing:
                         try:
-                            ticker = await exchange.fetch_ticker(pair_symbol)
-                            current_price = Decimal(str(ticker["last"]))
-
-                            positions.append(
-                                Position(
-                                    symbol=pair_symbol.replace("/", ""),
-                                    side=PositionSide.LONG,  # Spot is always long
-                                    entry_price=current_price,  # Approximation
-                                    amount=Decimal(str(amount)),
-                                    unrealized_pnl=Decimal("0"),
-                                    metadata={"spot": True},
-                                )
-                            )
-                        except:
+                            tickers.update(await exchange.fetch_tickers(missing))
+                        except ccxt.BadRequest:
+                            # A pair isn't listed; fall back to the whole market
+                            tickers.update(await exchange.fetch_tickers())
+
+                    for pair_symbol, amount in holdings:
+                        ticker = tickers.get(pair_symbol)
+                        if not ticker or not ticker.get("last"):
                             # Skip if we can't get price
-                            pass
+                            continue
 
-            logger.debug(
-                "bybit_client.positions_fetched",
-                subaccount=subaccount,
-                symbol=symbol,
-                count=len(positions),
-            )
+                        positions.append(
+                            Position(
+                                symbol=pair_symbol.replace("/", ""),
+                                side=PositionSide.LONG,  # Spot is always long
+                                # Approximation: spot has no entry price
+                                entry_price=Decimal(str(ticker["last"])),
+                                amount=Decimal(str(amount)),
+                                unrealized_pnl=Decimal("0"),
+                                metadata={"spot": True},
+                            )
+                        )
+
+            if _std_logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "bybit_client.positions_fetched",
+                    subaccount=subaccount,
+                    symbol=symbol,
+                    count=len(positions),
+                )
 
             return positions
 
@@ -1034,40 +1715,28 @@ class ByBitClient:
             raise ValueError(f"Subaccount '{subaccount}' is read-only")
 
         # Paper trading mode
-        if trading_config.trading_mode == "paper":
+        if self._paper:
             return await self._simulate_order(
                 subaccount, symbol, side, order_type, amount, price, params
             )
 
         exchange = self._get_exchange(subaccount)
-
-        # Normalize inputs
-        if isinstance(side, OrderSide):
-            side = side.value
-        if isinstance(order_type, OrderType):
-            order_type = order_type.value
-
-        # Validate limit order has price
-        if order_type == "limit" and price is None:
-            raise ValueError("Price is required for limit orders")
-
-        # Prepare parameters
-        order_params = params or {}
-
-        # Add leverage for perpetual orders if not specified
-        if (
-            config.default_market in ["linear", "inverse"]
-            and "leverage" not in order_params
-        ):
-            order_params["leverage"] = config.max_leverage
+        side, order_type, order_params = self._prepare_order_request(
+            config,
+            side,
+            order_type,
+            price,
+            params,
+            demo=isinstance(exchange, PybitDemoClient),
+        )
 
         try:
             result = await exchange.create_order(
                 symbol=symbol,
                 type=order_type,
                 side=side,
-                amount=float(amount),
-                price=float(price) if price else None,
+                amount=str(amount),
+                price=str(price) if price else None,
                 params=order_params,
             )
 
@@ -1079,31 +1748,15 @@ class ByBitClient:
                 return result
 
             # Handle ccxt-style dictionary response
-            order = Order(
-                symbol=symbol,
-                side=OrderSide(side),
-                order_type=OrderType(order_type),
-                amount=amount,
-                price=price,
-                exchange_order_id=result.get("id"),
-                status=self._map_order_status(result.get("status")),
-                filled_amount=Decimal(str(result.get("filled", 0))),
-                average_price=(
-                    Decimal(str(result.get("average", 0)))
-                    if result.get("average")
-                    else None
-                ),
-                stop_loss_price=(
-                    Decimal(str(order_params.get("stopLoss")))
-                    if order_params.get("stopLoss")
-                    else None
-                ),
-                take_profit_price=(
-                    Decimal(str(order_params.get("takeProfit")))
-                    if order_params.get("takeProfit")
-                    else None
-                ),
-                metadata={"raw_response": result, "subaccount": subaccount},
+            order = self._order_from_result(
+                result,
+                subaccount,
+                symbol,
+                side,
+                order_type,
+                amount,
+                price,
+                order_params,
             )
 
             logger.info(
@@ -1130,6 +1783,9 @@ class ByBitClient:
             )
             raise
         except Exception as e:
+            if isinstance(e, ccxt.BadSymbol):
+                # The listing may have changed since the markets were cached
+                await self._invalidate_markets(exchange)
             logger.error(
                 "bybit_client.order_error",
                 subaccount=subaccount,
@@ -1139,40 +1795,277 @@ class ByBitClient:
             )
             raise
 
-    async def _simulate_order(
+    def _prepare_order_request(
         self,
-        subaccount: str,
-        symbol: str,
+        config: SubAccountConfig,
         side: Union[OrderSide, str],
         order_type: Union[OrderType, str],
-        amount: Decimal,
         price: Optional[Decimal],
         params: Optional[Dict],
-    ) -> Order:
-        """Simulate an order for paper trading."""
+        demo: bool = False,
+    ) -> Tuple[str, str, Dict]:
+        """Normalize order inputs and add the subaccount's default params.
+
+        params['mark_price'] is a sizing hint only PybitDemoClient reads; it
+        is dropped unless ``demo`` is set, so ccxt never sends it to Bybit.
+        """
         if isinstance(side, OrderSide):
             side = side.value
         if isinstance(order_type, OrderType):
             order_type = order_type.value
 
-        # Get current price for simulation
-        try:
-            ticker = await self.fetch_ticker(symbol)
-            sim_price = price or ticker["last"]
-        except:
-            sim_price = price or Decimal("0")
+        # Validate limit order has price
+        if order_type == "limit" and price is None:
+            raise ValueError("Price is required for limit orders")
 
-        logger.warning(
-            "bybit_client.paper_trade",
-            subaccount=subaccount,
-            symbol=symbol,
-            side=side,
-            order_type=order_type,
-            amount=str(amount),
-            price=str(price) if price else str(sim_price),
-        )
+        # Prepare parameters
+        order_params = params or {}
+        if not demo and "mark_price" in order_params:
+            # Copy rather than pop, the caller may reuse its params
+            order_params = {k: v for k, v in order_params.items() if k != "mark_price"}
 
-        return Order(
+        # Add leverage for perpetual orders if not specified
+        if config.default_market in _PERP_MARKETS and "leverage" not in order_params:
+            order_params["leverage"] = config.max_leverage
+
+        return side, order_type, order_params
+
+    def _order_from_result(
+        self,
+        result: Dict[str, Any],
+        subaccount: str,
+        symbol: str,
+        side: str,
+        order_type: str,
+        amount: Decimal,
+        price: Optional[Decimal],
+        order_params: Dict,
+    ) -> Order:
+        """Build an Order from the request and ccxt's create-order response."""
+        return Order(
+            symbol=symbol,
+            side=OrderSide(side),
+            order_type=OrderType(order_type),
+            amount=amount,
+            price=price,
+            exchange_order_id=result.get("id"),
+            status=self._map_order_status(result.get("status")),
+            filled_amount=Decimal(str(result.get("filled") or 0)),
+            average_price=(
+                Decimal(str(result.get("average", 0)))
+                if result.get("average")
+                else None
+            ),
+            stop_loss_price=(
+                Decimal(str(order_params.get("stopLoss")))
+                if order_params.get("stopLoss")
+                else None
+            ),
+            take_profit_price=(
+                Decimal(str(order_params.get("takeProfit")))
+                if order_params.get("takeProfit")
+                else None
+            ),
+            metadata={"raw_response": result, "subaccount": subaccount},
+        )
+
+    async def _limited(self, coro):
+        """Await a batched request, with at most max_concurrent_requests in flight."""
+        if self._request_semaphore is None:
+            self._request_semaphore = asyncio.Semaphore(
+                core_config.engine_config.bybit.max_concurrent_requests
+            )
+        async with self._request_semaphore:
+            return await coro
+
+    async def create_orders(self, specs: List[Dict[str, Any]]) -> List[Any]:
+        """Create several orders concurrently.
+
+        Args:
+            specs: Keyword arguments for create_order, one dict per order
+
+        Returns:
+            One entry per spec, in order: the Order, or the exception that
+            order raised
+
+        Note:
+            At most max_concurrent_requests orders are in flight at once.
+            Real orders also share the exchange's client-side rate limiter
+            (enableRateLimit), which spaces out the underlying requests.
+        """
+        return await asyncio.gather(
+            *(self._limited(self.create_order(**spec)) for spec in specs),
+            return_exceptions=True,
+        )
+
+    async def create_orders_batch(
+        self, subaccount: str, specs: List[Dict[str, Any]]
+    ) -> List[Any]:
+        """Create several orders on one subaccount via the batch endpoint.
+
+        Orders go to /v5/order/create-batch in chunks of at most
+        MAX_BATCH_ORDERS for the subaccount's market, so N orders cost
+        about N / chunk round trips instead of N. Paper mode and demo
+        subaccounts use create_orders (the demo client batches on its own).
+        Batches are not retried, since a retry could place orders twice.
+
+        Args:
+            subaccount: Subaccount to place the orders on
+            specs: Keyword arguments for create_order without subaccount
+                (symbol, side, order_type, amount, price, params)
+
+        Returns:
+            One entry per spec, in order: the Order, or the exception for
+            that order (a rejected order gives ccxt.InvalidOrder)
+        """
+        exchange = self._get_exchange(subaccount)
+        if self._paper or isinstance(exchange, PybitDemoClient):
+            return await self.create_orders(
+                [{**spec, "subaccount": subaccount} for spec in specs]
+            )
+
+        config = self._get_config(subaccount)
+        if config.is_read_only:
+            raise ValueError(f"Subaccount '{subaccount}' is read-only")
+
+        results: List[Any] = [None] * len(specs)
+        requests: List[_BatchOrder] = []
+        for i, spec in enumerate(specs):
+            try:
+                side, order_type, order_params = self._prepare_order_request(
+                    config,
+                    spec["side"],
+                    spec["order_type"],
+                    spec.get("price"),
+                    spec.get("params"),
+                )
+            except ValueError as e:
+                results[i] = e
+                continue
+            requests.append(
+                _BatchOrder(
+                    i,
+                    spec["symbol"],
+                    side,
+                    order_type,
+                    spec["amount"],
+                    spec.get("price"),
+                    order_params,
+                )
+            )
+
+        size = self.MAX_BATCH_ORDERS.get(config.default_market, 10)
+        chunks = [requests[i : i + size] for i in range(0, len(requests), size)]
+
+        async def submit(chunk):
+            return await exchange.create_orders(
+                [
+                    {
+                        "symbol": order.symbol,
+                        "type": order.order_type,
+                        "side": order.side,
+                        "amount": str(order.amount),
+                        "price": str(order.price) if order.price else None,
+                        "params": order.params,
+                    }
+                    for order in chunk
+                ]
+            )
+
+        responses = await asyncio.gather(
+            *(self._limited(submit(chunk)) for chunk in chunks),
+            return_exceptions=True,
+        )
+
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, Exception):
+                logger.error(
+                    "bybit_client.batch_order_error",
+                    subaccount=subaccount,
+                    count=len(chunk),
+                    error=str(response),
+                )
+                for order in chunk:
+                    results[order.index] = response
+                continue
+
+            for order, result in zip(chunk, response):
+                info = result.get("info") or {}
+                code = info.get("code")
+                if code not in (None, 0, "0"):
+                    results[order.index] = ccxt.InvalidOrder(
+                        f"{order.symbol}: {info.get('msg')} ({code})"
+                    )
+                    continue
+                results[order.index] = self._order_from_result(
+                    result,
+                    subaccount,
+                    order.symbol,
+                    order.side,
+                    order.order_type,
+                    order.amount,
+                    order.price,
+                    order.params,
+                )
+
+        logger.info(
+            "bybit_client.batch_orders_created",
+            subaccount=subaccount,
+            count=len(specs),
+            requests=len(chunks),
+            failed=sum(isinstance(r, Exception) for r in results),
+        )
+
+        return results
+
+    async def _simulate_order(
+        self,
+        subaccount: str,
+        symbol: str,
+        side: Union[OrderSide, str],
+        order_type: Union[OrderType, str],
+        amount: Decimal,
+        price: Optional[Decimal],
+        params: Optional[Dict],
+    ) -> Order:
+        """Simulate an order for paper trading."""
+        # Only look up the market price when the caller didn't give one,
+        # and start the request before the local bookkeeping below
+        ticker_task = (
+            asyncio.create_task(self.fetch_ticker(symbol)) if not price else None
+        )
+
+        if isinstance(side, OrderSide):
+            side = side.value
+        if isinstance(order_type, OrderType):
+            order_type = order_type.value
+
+        # Get current price for simulation
+        sim_price = price
+        if ticker_task is not None:
+            try:
+                sim_price = (await ticker_task)["last"]
+            except Exception as e:
+                # Not a bare except, so task cancellation still propagates
+                logger.debug(
+                    "bybit_client.paper_price_unavailable", symbol=symbol, error=str(e)
+                )
+                sim_price = Decimal("0")
+
+        # Backtests simulate thousands of orders; skip the str() calls
+        # and event dict when warnings are filtered out
+        if _std_logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "bybit_client.paper_trade",
+                subaccount=subaccount,
+                symbol=symbol,
+                side=side,
+                order_type=order_type,
+                amount=str(amount),
+                price=str(price) if price else str(sim_price),
+            )
+
+        return Order(
             symbol=symbol,
             side=OrderSide(side),
             order_type=OrderType(order_type),
@@ -1201,7 +2094,7 @@ class ByBitClient:
         if config.is_read_only:
             raise ValueError(f"Subaccount '{subaccount}' is read-only")
 
-        if trading_config.trading_mode == "paper":
+        if self._paper:
             logger.info(
                 "bybit_client.paper_cancel", subaccount=subaccount, order_id=order_id
             )
@@ -1234,7 +2127,6 @@ class ByBitClient:
             )
             raise
 
-    @with_retry()
     async def get_order_status(
         self, subaccount: str, order_id: str, symbol: str
     ) -> OrderStatus:
@@ -1248,9 +2140,38 @@ class ByBitClient:
         Returns:
             OrderStatus enum value
         """
-        if trading_config.trading_mode == "paper":
+        # Paper mode answers before entering the retry wrapper
+        if self._paper:
             return OrderStatus.FILLED
 
+        return await self._fetch_order_status(subaccount, order_id, symbol)
+
+    async def get_order_statuses(
+        self, subaccount: str, orders: List[Tuple[str, str]]
+    ) -> List[Any]:
+        """Get the status of several orders concurrently.
+
+        Args:
+            subaccount: Subaccount containing the orders
+            orders: (order_id, symbol) pairs
+
+        Returns:
+            One entry per pair, in order: the OrderStatus, or the exception
+            that lookup raised
+        """
+        return await asyncio.gather(
+            *(
+                self._limited(self.get_order_status(subaccount, order_id, symbol))
+                for order_id, symbol in orders
+            ),
+            return_exceptions=True,
+        )
+
+    @with_retry()
+    async def _fetch_order_status(
+        self, subaccount: str, order_id: str, symbol: str
+    ) -> OrderStatus:
+        """Fetch an order's status from the exchange."""
         exchange = self._get_exchange(subaccount)
 
         try:
@@ -1267,7 +2188,6 @@ class ByBitClient:
             )
             raise
 
-    @with_retry()
     async def get_open_orders(
         self, subaccount: str, symbol: Optional[str] = None
     ) -> List[Order]:
@@ -1280,35 +2200,75 @@ class ByBitClient:
         Returns:
             List of open Order objects
         """
-        if trading_config.trading_mode == "paper":
+        # Paper mode answers before entering the retry wrapper
+        if self._paper:
             return []
 
-        exchange = self._get_exchange(subaccount)
-
+        # An unknown subaccount is a configuration error, not an empty book
+        self._get_exchange(subaccount)
         try:
-            orders = await exchange.fetch_open_orders(symbol)
-            return [
-                Order(
-                    symbol=o["symbol"],
-                    side=OrderSide(o["side"]),
-                    order_type=OrderType(o["type"]),
-                    amount=Decimal(str(o["amount"])),
-                    price=Decimal(str(o["price"])) if o["price"] else None,
-                    exchange_order_id=o["id"],
-                    status=self._map_order_status(o["status"]),
-                    filled_amount=Decimal(str(o["filled"])),
-                    average_price=Decimal(str(o["average"])) if o["average"] else None,
-                    metadata={"subaccount": subaccount},
-                )
-                for o in orders
-            ]
+            return await self._fetch_open_orders(subaccount, symbol)
         except Exception as e:
             logger.error(
                 "bybit_client.open_orders_error", subaccount=subaccount, error=str(e)
             )
             return []
 
+    async def get_open_orders_cached(
+        self, subaccount: str, symbol: Optional[str] = None
+    ) -> List[Order]:
+        """Get open orders from the streamed order book where possible.
+
+        For a subaccount with an order stream (see subscribe_orders), the
+        book is loaded once over REST and then kept current by the stream,
+        so reconcile polls cost no request. It is reloaded over REST every
+        OPEN_ORDERS_RESYNC seconds to correct any missed update. Other
+        subaccounts go straight to get_open_orders.
+
+        Args:
+            subaccount: Subaccount to query
+            symbol: Optional symbol filter, in exchange or ccxt format
+
+        Returns:
+            List of open Order objects
+        """
+        if self._paper or subaccount not in self._order_tasks:
+            return await self.get_open_orders(subaccount, symbol)
+
+        self._get_exchange(subaccount)
+        synced = self._open_orders_synced.get(subaccount)
+        if synced is None or time.monotonic() - synced > self.OPEN_ORDERS_RESYNC:
+            try:
+                orders = await self._fetch_open_orders(subaccount)
+            except Exception as e:
+                # Keep serving the streamed book; the next call retries
+                logger.error(
+                    "bybit_client.open_orders_error",
+                    subaccount=subaccount,
+                    error=str(e),
+                )
+            else:
+                self._open_orders[subaccount] = {o.exchange_order_id: o for o in orders}
+                self._open_orders_synced[subaccount] = time.monotonic()
+
+        orders = list(self._open_orders.get(subaccount, {}).values())
+        if symbol is None:
+            return orders
+        unified = _to_ccxt_symbol(symbol)
+        return [
+            o for o in orders if o.symbol == symbol or o.symbol.split(":")[0] == unified
+        ]
+
     @with_retry()
+    async def _fetch_open_orders(
+        self, subaccount: str, symbol: Optional[str] = None
+    ) -> List[Order]:
+        """Fetch open orders from the exchange as Order objects."""
+        exchange = self._get_exchange(subaccount)
+        orders = await exchange.fetch_open_orders(symbol)
+        to_order = self._order_from_ccxt
+        return [to_order(o, subaccount) for o in orders]
+
     async def fetch_ohlcv(
         self,
         symbol: str,
@@ -1327,44 +2287,177 @@ class ByBitClient:
         Returns:
             List of MarketData objects
         """
-        # Use MASTER subaccount or any available for market data
-        exchange = None
-        if SubAccountType.MASTER.value in self.exchanges:
-            exchange = self.exchanges[SubAccountType.MASTER.value]
-        elif self.exchanges:
-            exchange = next(iter(self.exchanges.values()))
-        else:
-            raise ValueError("No exchanges initialized for market data")
+        exchange = self._get_market_data_exchange()
+        return await self._fetch_candles(
+            exchange, symbol, timeframe, limit, market_type
+        )
 
-        try:
-            # Temporarily set market type
-            original_type = exchange.options.get("defaultType")
-            exchange.options["defaultType"] = market_type
+    async def fetch_ohlcv_raw(
+        self,
+        symbol: str,
+        timeframe: str = "1h",
+        limit: int = 100,
+        market_type: str = "spot",
+    ) -> np.ndarray:
+        """Fetch OHLCV data as a float array, without building MarketData.
 
-            ohlcv = await exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+        Intended for indicator and backtest code that works on floats
+        anyway; use fetch_ohlcv where exact Decimal prices are needed.
 
-            # Restore original type
-            exchange.options["defaultType"] = original_type
+        Args:
+            symbol: Trading pair (e.g., 'BTCUSDT')
+            timeframe: Candle interval (1m, 5m, 15m, 1h, 4h, 1d, 1w, 1M)
+            limit: Number of candles to fetch (max 1000)
+            market_type: 'spot', 'linear', or 'inverse'
 
-            market_data = []
-            for candle in ohlcv:
-                # OHLCV format: [timestamp, open, high, low, close, volume]
-                market_data.append(
-                    MarketData(
-                        symbol=symbol,
-                        timestamp=datetime.fromtimestamp(candle[0] / 1000),
-                        open=Decimal(str(candle[1])),
-                        high=Decimal(str(candle[2])),
-                        low=Decimal(str(candle[3])),
-                        close=Decimal(str(candle[4])),
-                        volume=Decimal(str(candle[5])),
-                        timeframe=timeframe,
-                    )
+        Returns:
+            Array of shape (N, 6): timestamp (ms), open, high, low, close, volume
+        """
+        exchange = self._get_market_data_exchange()
+        rows = await self._fetch_ohlcv_rows(
+            exchange, symbol, timeframe, limit, market_type
+        )
+        # Fill the array straight from the flattened rows; asarray would
+        # first inspect every nested list to work out the shape
+        return np.fromiter(
+            chain.from_iterable(rows), dtype=np.float64, count=len(rows) * 6
+        ).reshape(-1, 6)
+
+    async def fetch_ohlcv_many(
+        self,
+        symbols: List[str],
+        timeframe: str = "1h",
+        limit: int = 100,
+        market_type: str = "spot",
+        max_concurrency: int = 8,
+    ) -> Dict[str, List[MarketData]]:
+        """Fetch OHLCV data for several symbols concurrently.
+
+        Bybit has no multi-symbol kline endpoint, so this issues one request
+        per symbol with at most max_concurrency in flight; ccxt's rate
+        limiter still paces the requests themselves.
+
+        Args:
+            symbols: Trading pairs (e.g., ['BTCUSDT', 'ETHUSDT'])
+            timeframe: Candle interval (1m, 5m, 15m, 1h, 4h, 1d, 1w, 1M)
+            limit: Number of candles to fetch per symbol (max 1000)
+            market_type: 'spot', 'linear', or 'inverse'
+            max_concurrency: Maximum requests in flight at once
+
+        Returns:
+            Dictionary mapping symbol to its MarketData list. Symbols that
+            failed after retries are logged and left out.
+        """
+        exchange = self._get_market_data_exchange()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_limited(symbol: str) -> List[MarketData]:
+            async with semaphore:
+                return await self._fetch_candles(
+                    exchange, symbol, timeframe, limit, market_type
                 )
 
-            return market_data
+        results = await asyncio.gather(
+            *(fetch_limited(s) for s in symbols), return_exceptions=True
+        )
+
+        return {
+            symbol: result
+            for symbol, result in zip(symbols, results)
+            if not isinstance(result, Exception)
+        }
+
+    def _get_market_data_exchange(self) -> ccxt.bybit:
+        """Get the exchange used for market data (MASTER, else any)."""
+        if SubAccountType.MASTER.value in self.exchanges:
+            return self.exchanges[SubAccountType.MASTER.value]
+        if self.exchanges:
+            return next(iter(self.exchanges.values()))
+        raise ValueError("No exchanges initialized for market data")
+
+    @staticmethod
+    def _resolve_symbol(exchange: ccxt.bybit, symbol: str, market_type: str) -> str:
+        """Map an exchange id (e.g. 'BTCUSDT') to the unified symbol for a market type.
+
+        ccxt resolves bare ids through options['defaultType'], which is shared
+        by every task using the exchange; naming the market explicitly keeps
+        concurrent spot and perpetual requests independent.
+        """
+        markets_by_id = getattr(exchange, "markets_by_id", None)
+        if isinstance(markets_by_id, dict):
+            for market in markets_by_id.get(symbol, ()):
+                if market.get(market_type):
+                    return market["symbol"]
+        return symbol
+
+    async def _fetch_candles(
+        self,
+        exchange: ccxt.bybit,
+        symbol: str,
+        timeframe: str,
+        limit: int,
+        market_type: str,
+    ) -> List[MarketData]:
+        """Fetch candles for one symbol and convert them to MarketData."""
+        ohlcv = await self._fetch_ohlcv_rows(
+            exchange, symbol, timeframe, limit, market_type
+        )
+
+        # OHLCV format: [timestamp, open, high, low, close, volume].
+        # Locals skip global lookups across up to 1000 candles; str() is
+        # kept because Decimal.from_float would carry the binary error.
+        # Prices repeat across candles and go through the memoized
+        # converter; volumes rarely repeat and would only churn its cache
+        dec = Decimal
+        price = _price_to_decimal
+        # One numpy cast instead of a fromtimestamp() call per candle;
+        # tolist() yields naive UTC datetimes
+        timestamps = (
+            np.fromiter((row[0] for row in ohlcv), dtype=np.int64, count=len(ohlcv))
+            .astype("datetime64[ms]")
+            .tolist()
+        )
+        return [
+            MarketData(
+                symbol=symbol,
+                timestamp=timestamp,
+                open=price(open_),
+                high=price(high),
+                low=price(low),
+                close=price(close),
+                volume=dec(str(volume)),
+                timeframe=timeframe,
+            )
+            for timestamp, (_, open_, high, low, close, volume) in zip(
+                timestamps, ohlcv
+            )
+        ]
+
+    @with_retry()
+    async def _fetch_ohlcv_rows(
+        self,
+        exchange: ccxt.bybit,
+        symbol: str,
+        timeframe: str,
+        limit: int,
+        market_type: str,
+    ) -> List[List[float]]:
+        """Fetch raw [timestamp, open, high, low, close, volume] rows."""
+        try:
+            # Resolve symbols from cached metadata, not a fresh instruments-info
+            if not isinstance(exchange, PybitDemoClient):
+                await self._get_markets(exchange)
+
+            return await exchange.fetch_ohlcv(
+                self._resolve_symbol(exchange, symbol, market_type),
+                timeframe,
+                limit=limit,
+            )
 
         except Exception as e:
+            if isinstance(e, ccxt.BadSymbol):
+                # The listing may have changed since the markets were cached
+                await self._invalidate_markets(exchange)
             logger.error(
                 "bybit_client.ohlcv_error",
                 symbol=symbol,
@@ -1385,40 +2478,249 @@ class ByBitClient:
         """
         return await self.fetch_ticker(symbol)
 
+    async def get_tickers_batch(self, symbols: List[str]) -> List[Any]:
+        """Get ticker data for several symbols concurrently.
+
+        Requests share the market data exchange, so its rate limiter still
+        paces them while they overlap in flight, at most
+        max_concurrent_requests at a time.
+
+        Args:
+            symbols: Trading pairs (e.g., ['BTCUSDT', 'ETHUSDT'])
+
+        Returns:
+            One entry per symbol, in order: the fetch_ticker dictionary, or
+            the exception that lookup raised
+        """
+        return await asyncio.gather(
+            *(self._limited(self.fetch_ticker(symbol)) for symbol in symbols),
+            return_exceptions=True,
+        )
+
+    async def subscribe_tickers(self, symbols: List[str]):
+        """Stream spot tickers over WebSocket instead of polling REST.
+
+        Subscribed symbols are served from the latest push by fetch_ticker
+        and get_positions, and each update is passed to the registered
+        price callbacks. Symbols without a fresh push still use REST.
+
+        Args:
+            symbols: Trading pairs (e.g., ['BTCUSDT', 'ETHUSDT'])
+        """
+        if self._ws_exchange is None:
+            self._ws_exchange = ccxtpro.bybit({"options": {"defaultType": "spot"}})
+            # Stream from the same environment the REST market data uses
+            rest_exchange = self._get_market_data_exchange()
+            if getattr(rest_exchange, "isSandboxModeEnabled", False) is True:
+                self._ws_exchange.set_sandbox_mode(True)
+
+        for symbol in symbols:
+            if symbol not in self._ticker_tasks:
+                self._ticker_tasks[symbol] = asyncio.create_task(
+                    self._watch_ticker(symbol)
+                )
+        self._ws_connected = True
+
+        logger.info("bybit_client.tickers_subscribed", symbols=list(self._ticker_tasks))
+
+    async def _watch_ticker(self, symbol: str):
+        """Keep the cached ticker for one symbol up to date."""
+        while True:
+            try:
+                ticker = await self._ws_exchange.watch_ticker(symbol)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # ccxt.pro reconnects on the next watch call
+                self._ticker_cache.pop(symbol, None)
+                logger.warning(
+                    "bybit_client.ticker_stream_error", symbol=symbol, error=str(e)
+                )
+                await asyncio.sleep(self.STREAM_RETRY_DELAY)
+                continue
+
+            self._ticker_cache[symbol] = (time.monotonic(), ticker)
+            if ticker.get("last") and self._price_callbacks:
+                await self._run_callbacks(
+                    self._price_callbacks, symbol, Decimal(str(ticker["last"]))
+                )
+
+    async def subscribe_orders(self, subaccounts: Optional[List[str]] = None):
+        """Stream order updates over WebSocket into the order callbacks.
+
+        Each subscribed subaccount gets its own authenticated stream, so
+        fills and cancels arrive as pushes instead of get_order_status
+        polls. Demo subaccounts are skipped; ccxt.pro has no stream for the
+        demo trading host.
+
+        Args:
+            subaccounts: Subaccounts to stream. If None, all initialized ones.
+        """
+        for name in subaccounts or list(self.exchanges):
+            if name in self._order_tasks:
+                continue
+            exchange = self._get_exchange(name)
+            if isinstance(exchange, PybitDemoClient):
+                logger.info("bybit_client.order_stream_unsupported", subaccount=name)
+                continue
+
+            config = self._get_config(name)
+            stream = ccxtpro.bybit(
+                {
+                    "apiKey": config.api_key,
+                    "secret": config.api_secret,
+                    "options": {"defaultType": config.default_market},
+                }
+            )
+            if getattr(exchange, "isSandboxModeEnabled", False) is True:
+                stream.set_sandbox_mode(True)
+            self._order_streams[name] = stream
+            self._order_tasks[name] = asyncio.create_task(self._watch_orders(name))
+            self._ws_connected = True
+
+        logger.info(
+            "bybit_client.orders_subscribed", subaccounts=list(self._order_tasks)
+        )
+
+    async def _watch_orders(self, subaccount: str):
+        """Pass every order update for one subaccount to the order callbacks."""
+        stream = self._order_streams[subaccount]
+        while True:
+            try:
+                updates = await stream.watch_orders()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # ccxt.pro reconnects on the next watch call
+                logger.warning(
+                    "bybit_client.order_stream_error",
+                    subaccount=subaccount,
+                    error=str(e),
+                )
+                await asyncio.sleep(self.STREAM_RETRY_DELAY)
+                continue
+
+            for update in updates:
+                try:
+                    order = self._order_from_ccxt(update, subaccount)
+                except Exception as e:
+                    # e.g. order types the Order model doesn't cover
+                    logger.debug(
+                        "bybit_client.order_update_skipped",
+                        subaccount=subaccount,
+                        error=str(e),
+                    )
+                    continue
+                book = self._open_orders.get(subaccount)
+                if book is not None:
+                    if order.status in self._OPEN_STATUSES:
+                        book[order.exchange_order_id] = order
+                    else:
+                        book.pop(order.exchange_order_id, None)
+                await self._run_callbacks(self._order_callbacks, order)
+
+    async def _run_callbacks(self, callbacks: List[Callable], *args):
+        """Call every registered callback, awaiting the async ones."""
+        for callback in callbacks:
+            try:
+                result = callback(*args)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.warning(
+                    "bybit_client.callback_error",
+                    callback=getattr(callback, "__name__", repr(callback)),
+                    error=str(e),
+                )
+
+    def _cached_ticker(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Return the streamed ticker for a symbol if it is still fresh."""
+        cached = self._ticker_cache.get(symbol)
+        if cached is None or time.monotonic() - cached[0] > self.TICKER_MAX_AGE:
+            return None
+        return cached[1]
+
     async def fetch_ticker(self, symbol: str) -> Dict[str, Any]:
         """Get current ticker data for a symbol.
 
+        Served from the ticker stream when the symbol is subscribed and
+        fresh, otherwise fetched over REST.
+
         Args:
             symbol: Trading pair (e.g., 'BTCUSDT')
 
         Returns:
             Dictionary with last price, bid, ask, volume, timestamp
         """
-        # Use any available exchange for market data
-        exchange = None
-        if SubAccountType.MASTER.value in self.exchanges:
-            exchange = self.exchanges[SubAccountType.MASTER.value]
-        elif self.exchanges:
-            exchange = next(iter(self.exchanges.values()))
-        else:
-            raise ValueError("No exchanges initialized for market data")
-
         try:
-            ticker = await exchange.fetch_ticker(symbol)
-            return {
-                "symbol": symbol,
-                "last": Decimal(str(ticker["last"])),
-                "bid": Decimal(str(ticker["bid"])),
-                "ask": Decimal(str(ticker["ask"])),
-                "volume": Decimal(str(ticker.get("quoteVolume", 0))),
-                "timestamp": ticker["timestamp"],
-                "change_24h": Decimal(str(ticker.get("change", 0))),
-                "change_pct_24h": Decimal(str(ticker.get("percentage", 0))),
-            }
+            ticker = self._cached_ticker(symbol)
+            if ticker is None:
+                # Use any available exchange for market data
+                exchange = self._get_market_data_exchange()
+                ticker = await exchange.fetch_ticker(symbol)
+            return self._ticker_to_dict(symbol, ticker)
         except Exception as e:
             logger.error("bybit_client.ticker_error", symbol=symbol, error=str(e))
             raise
 
+    async def get_tickers(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get ticker data for several symbols in one request.
+
+        Fresh streamed tickers are used as is; the rest come from a single
+        fetch_tickers call instead of one fetch_ticker request per symbol.
+
+        Args:
+            symbols: Trading pairs (e.g., ['BTCUSDT', 'ETHUSDT'])
+
+        Returns:
+            Symbol -> fetch_ticker dictionary; symbols the exchange did not
+            return are left out
+        """
+        tickers = {}
+        missing = []
+        for symbol in symbols:
+            ticker = self._cached_ticker(symbol)
+            if ticker is None:
+                missing.append(symbol)
+            else:
+                tickers[symbol] = ticker
+
+        if missing:
+            try:
+                exchange = self._get_market_data_exchange()
+                fetched = await exchange.fetch_tickers(
+                    [_to_ccxt_symbol(s) for s in missing]
+                )
+            except Exception as e:
+                logger.error(
+                    "bybit_client.tickers_error", symbols=missing, error=str(e)
+                )
+                raise
+            for symbol in missing:
+                ticker = fetched.get(_to_ccxt_symbol(symbol))
+                if ticker is not None:
+                    tickers[symbol] = ticker
+
+        return {
+            symbol: self._ticker_to_dict(symbol, tickers[symbol])
+            for symbol in symbols
+            if symbol in tickers
+        }
+
+    @staticmethod
+    def _ticker_to_dict(symbol: str, ticker: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a ccxt ticker to the fetch_ticker dictionary."""
+        return {
+            "symbol": symbol,
+            "last": Decimal(str(ticker["last"])),
+            "bid": Decimal(str(ticker["bid"])),
+            "ask": Decimal(str(ticker["ask"])),
+            "volume": Decimal(str(ticker.get("quoteVolume", 0))),
+            "timestamp": ticker["timestamp"],
+            "change_24h": Decimal(str(ticker.get("change", 0))),
+            "change_pct_24h": Decimal(str(ticker.get("percentage", 0))),
+        }
+
     @with_retry()
     async def get_funding_rate(
         self, symbol: str, since: Optional[int] = None, limit: int = 1
@@ -1446,17 +2748,13 @@ class ByBitClient:
             raise ValueError("No exchanges initialized for funding data")
 
         try:
-            # Set to linear market for funding rates
-            original_type = exchange.options.get("defaultType")
-            exchange.options["defaultType"] = "linear"
-
+            # Funding rates only exist on the linear market
+            if not isinstance(exchange, PybitDemoClient):
+                await self._get_markets(exchange)
             funding_rates = await exchange.fetch_funding_rate_history(
-                symbol, since, limit
+                self._resolve_symbol(exchange, symbol, "linear"), since, limit
             )
 
-            # Restore original type
-            exchange.options["defaultType"] = original_type
-
             result = []
             for rate in funding_rates:
                 result.append(
@@ -1468,9 +2766,12 @@ class ByBitClient:
                     }
                 )
 
-            logger.debug(
-                "bybit_client.funding_rate_fetched", symbol=symbol, entries=len(result)
-            )
+            if _std_logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "bybit_client.funding_rate_fetched",
+                    symbol=symbol,
+                    entries=len(result),
+                )
 
             return result
 
@@ -1478,6 +2779,26 @@ class ByBitClient:
             logger.error("bybit_client.funding_rate_error", symbol=symbol, error=str(e))
             raise
 
+    async def snapshot(
+        self, subaccount: str, asset: str = "USDT"
+    ) -> Tuple[Portfolio, List[Position]]:
+        """Get a subaccount's balance and positions together.
+
+        Both requests are issued concurrently, so the pair costs one round
+        trip of latency instead of two.
+
+        Args:
+            subaccount: Subaccount name (e.g., 'CORE_HODL', 'TREND')
+            asset: Base asset for balance calculation (default: USDT)
+
+        Returns:
+            Tuple of (Portfolio, list of Position objects)
+        """
+        portfolio, positions = await asyncio.gather(
+            self.get_balance(subaccount, asset), self.get_positions(subaccount)
+        )
+        return portfolio, positions
+
     async def get_all_balances(self) -> Dict[str, Portfolio]:
         """Get balances for all initialized subaccounts.
 
@@ -1485,23 +2806,23 @@ class ByBitClient:
             Dictionary mapping subaccount names to Portfolio objects
         """
         balances = {}
-        tasks = []
+        subaccounts = list(self.exchanges.keys())
 
-        for subaccount in self.exchanges.keys():
-            task = self._get_balance_safe(subaccount)
-            tasks.append((subaccount, task))
+        # Fetch every subaccount concurrently rather than one after another
+        results = await asyncio.gather(
+            *(self._limited(self._get_balance_safe(s)) for s in subaccounts),
+            return_exceptions=True,
+        )
 
-        for subaccount, task in tasks:
-            try:
-                balance = await task
-                balances[subaccount] = balance
-            except Exception as e:
+        for subaccount, result in zip(subaccounts, results):
+            if isinstance(result, Exception):
                 logger.error(
                     "bybit_client.balance_fetch_failed",
                     subaccount=subaccount,
-                    error=str(e),
+                    error=str(result),
                 )
-                balances[subaccount] = None
+                result = None
+            balances[subaccount] = result
 
         return balances
 
@@ -1509,30 +2830,66 @@ class ByBitClient:
         """Safely get balance for a subaccount."""
         try:
             return await self.get_balance(subaccount)
-        except:
+        except Exception as e:
+            # get_balance already logged the failure; cancellation propagates
+            logger.debug(
+                "bybit_client.balance_skipped", subaccount=subaccount, error=str(e)
+            )
             return None
 
     def _map_order_status(self, status: Optional[str]) -> OrderStatus:
         """Map exchange order status to internal OrderStatus."""
         if not status:
             return OrderStatus.PENDING
+        # ccxt statuses are already lowercase; only Bybit-native ones
+        # (e.g. "Filled", "Cancelled") pay for lower()
+        mapped = self._ORDER_STATUS_MAP.get(status)
+        if mapped is not None:
+            return mapped
+        return self._ORDER_STATUS_MAP.get(status.lower(), OrderStatus.PENDING)
+
+    def _order_from_ccxt(self, o: Dict[str, Any], subaccount: str) -> Order:
+        """Build an Order from a ccxt order dict."""
+        # Locals keep the per-order field conversions off global lookups
+        dec = Decimal
+        price = o["price"]
+        average = o["average"]
+        return Order(
+            symbol=o["symbol"],
+            side=OrderSide(o["side"]),
+            order_type=OrderType(o["type"]),
+            amount=dec(str(o["amount"])),
+            price=dec(str(price)) if price else None,
+            exchange_order_id=o["id"],
+            status=self._map_order_status(o["status"]),
+            filled_amount=dec(str(o["filled"])),
+            average_price=dec(str(average)) if average else None,
+            metadata={"subaccount": subaccount},
+        )
 
-        status_map = {
-            "open": OrderStatus.OPEN,
-            "closed": OrderStatus.FILLED,
-            "canceled": OrderStatus.CANCELLED,
-            "cancelled": OrderStatus.CANCELLED,
-            "pending": OrderStatus.PENDING,
-            "rejected": OrderStatus.REJECTED,
-            "expired": OrderStatus.EXPIRED,
-            "NEW": OrderStatus.OPEN,
-            "PARTIALLY_FILLED": OrderStatus.PARTIALLY_FILLED,
-            "FILLED": OrderStatus.FILLED,
-            "CANCELED": OrderStatus.CANCELLED,
-            "REJECTED": OrderStatus.REJECTED,
-            "EXPIRED": OrderStatus.EXPIRED,
-        }
-        return status_map.get(status, OrderStatus.PENDING)
+    @staticmethod
+    def _position_from_ccxt(
+        pos: Dict[str, Any], symbol: Optional[str] = None
+    ) -> Optional[Position]:
+        """Build a Position from a ccxt position dict, or None if it is flat."""
+        dec = Decimal
+        get = pos.get
+        contracts = dec(str(get("contracts", 0)))
+        if contracts == 0:
+            return None
+        return Position(
+            symbol=get("symbol", symbol or ""),
+            side=PositionSide.LONG if contracts > 0 else PositionSide.SHORT,
+            entry_price=dec(str(get("entryPrice", 0))),
+            amount=abs(contracts),
+            unrealized_pnl=dec(str(get("unrealizedPnl", 0))),
+            realized_pnl=dec(str(get("realizedPnl", 0))),
+            metadata={
+                "leverage": get("leverage", 1),
+                "marginMode": get("marginMode", "cross"),
+                "liquidationPrice": get("liquidationPrice"),
+            },
+        )
 
     def register_price_callback(self, callback: Callable[[str, Decimal], Any]):
         """Register a callback for price updates."""
@@ -12,6 +12,7 @@ from src.risk.risk_manager import (
     RiskCheck,
     RiskRule,
     CircuitBreaker,
+    CircuitBreakerAction,
     RiskLevel,
     PositionSizingMethod,
     create_risk_manager,
@@ -22,6 +23,7 @@ __all__ = [
     'RiskCheck',
     'RiskRule',
     'CircuitBreaker',
+    'CircuitBreakerAction',
     'RiskLevel',
     'PositionSizingMethod',
     'create_risk_manager',
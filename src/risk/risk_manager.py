@@ -8,11 +8,14 @@ CRITICAL: Any changes to this file must be reviewed and tested thoroughly.
 Incorrect risk controls can lead to catastrophic losses.
 """
 
-from dataclasses import dataclass, field
+import logging
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta, timezone
 from decimal import ROUND_DOWN, Decimal
 from enum import Enum, auto
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 import structlog
 
@@ -21,6 +24,8 @@ from src.core.models import (CircuitBreakerLevel, Order, OrderSide, Portfolio,
                              Position, PositionSide, SignalType, TradingSignal)
 
 logger = structlog.get_logger(__name__)
+# Stdlib logger behind `logger`; structlog's filter_by_level consults its level
+_std_logger = logging.getLogger(__name__)
 
 
 class RiskLevel(Enum):
@@ -31,7 +36,7 @@ class RiskLevel(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RiskCheck:
     """Result of a risk validation check.
 
@@ -50,7 +55,25 @@ class RiskCheck:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+# Shared result for rules that pass, so the common path allocates nothing
+_PASSED = RiskCheck(passed=True)
+
+# Shared zero for the per-signal helpers; Decimal is immutable
+_ZERO = Decimal("0")
+_ONE = Decimal("1")
+
+# ATR stops never sit further than 50% from entry
+_ATR_STOP_FLOOR = Decimal("0.5")
+_ATR_STOP_CEILING = Decimal("1.5")
+
+# Order quantities are rounded down to this step
+_QUANTITY_STEP = Decimal("0.0001")
+
+# Share of available balance a new position may use
+_AVAILABLE_BALANCE_BUFFER = Decimal("0.95")
+
+
+@dataclass(slots=True)
 class RiskRule:
     """Individual risk rule definition.
 
@@ -67,7 +90,7 @@ class RiskRule:
     is_blocking: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreaker:
     """Circuit breaker state and configuration.
 
@@ -89,6 +112,41 @@ class CircuitBreaker:
     widen_stops_pct: Decimal = Decimal("0")  # Additional stop buffer
 
 
+@dataclass(frozen=True, slots=True)
+class CircuitBreakerAction:
+    """Actions applied when a circuit breaker level triggers.
+
+    Attributes:
+        reduce_positions_pct: Fraction of position size to cut (0.25 = 25%)
+        pause_new_entries: Whether new entries are blocked
+        pause_duration_hours: How long new entries stay paused, if timed
+        close_directional: Whether directional trading is disabled
+        full_liquidation: Whether all positions must be closed
+        widen_stops_pct: Additional stop-loss buffer
+        auto_recovery_drawdown: Drawdown at which the level resets itself
+        move_to_stables_pct: Fraction of the portfolio to move to stablecoins
+        manual_recovery_required: Whether a reset needs manual authorization
+        audit_required: Whether an audit is required before resuming
+        dual_auth_required: Whether a reset needs two authorizations
+    """
+
+    reduce_positions_pct: Decimal = Decimal("0")
+    pause_new_entries: bool = False
+    pause_duration_hours: Optional[int] = None
+    close_directional: bool = False
+    full_liquidation: bool = False
+    widen_stops_pct: Decimal = Decimal("0")
+    auto_recovery_drawdown: Optional[Decimal] = None
+    move_to_stables_pct: Optional[Decimal] = None
+    manual_recovery_required: bool = False
+    audit_required: bool = False
+    dual_auth_required: bool = False
+
+
+# Actions for a level without an entry in CIRCUIT_BREAKER_ACTIONS
+_NO_ACTION = CircuitBreakerAction()
+
+
 class PositionSizingMethod(Enum):
     """Position sizing calculation methods."""
 
@@ -124,43 +182,58 @@ class RiskManager:
         CircuitBreakerLevel.LEVEL_3: Decimal("0.20"),  # 20% drawdown
         CircuitBreakerLevel.LEVEL_4: Decimal("0.25"),  # 25% drawdown
     }
+    # Levels and their thresholds in ascending order, for bisect lookup
+    _CIRCUIT_BREAKER_ORDER, _CIRCUIT_BREAKER_THRESHOLDS = zip(
+        *sorted(CIRCUIT_BREAKER_LEVELS.items(), key=lambda x: x[1])
+    )
 
     # Circuit breaker actions
     CIRCUIT_BREAKER_ACTIONS = {
-        CircuitBreakerLevel.LEVEL_1: {
-            "reduce_positions_pct": Decimal("0.25"),
-            "pause_new_entries": False,
-            "close_directional": False,
-            "full_liquidation": False,
-            "widen_stops_pct": Decimal("0.005"),  # 0.5% additional buffer
-            "auto_recovery_drawdown": Decimal("0.05"),  # Recover at 5% from ATH
-        },
-        CircuitBreakerLevel.LEVEL_2: {
-            "reduce_positions_pct": Decimal("0.50"),
-            "pause_new_entries": True,
-            "pause_duration_hours": 72,
-            "close_directional": False,
-            "full_liquidation": False,
-            "widen_stops_pct": Decimal("0.01"),
-            "manual_recovery_required": True,
-        },
-        CircuitBreakerLevel.LEVEL_3: {
-            "reduce_positions_pct": Decimal("1.00"),
-            "pause_new_entries": True,
-            "close_directional": True,
-            "full_liquidation": False,
-            "move_to_stables_pct": Decimal("0.50"),
-            "audit_required": True,
-        },
-        CircuitBreakerLevel.LEVEL_4: {
-            "reduce_positions_pct": Decimal("1.00"),
-            "pause_new_entries": True,
-            "close_directional": True,
-            "full_liquidation": True,
-            "dual_auth_required": True,
-        },
+        CircuitBreakerLevel.LEVEL_1: CircuitBreakerAction(
+            reduce_positions_pct=Decimal("0.25"),
+            widen_stops_pct=Decimal("0.005"),  # 0.5% additional buffer
+            auto_recovery_drawdown=Decimal("0.05"),  # Recover at 5% from ATH
+        ),
+        CircuitBreakerLevel.LEVEL_2: CircuitBreakerAction(
+            reduce_positions_pct=Decimal("0.50"),
+            pause_new_entries=True,
+            pause_duration_hours=72,
+            widen_stops_pct=Decimal("0.01"),
+            manual_recovery_required=True,
+        ),
+        CircuitBreakerLevel.LEVEL_3: CircuitBreakerAction(
+            reduce_positions_pct=Decimal("1.00"),
+            pause_new_entries=True,
+            close_directional=True,
+            move_to_stables_pct=Decimal("0.50"),
+            audit_required=True,
+        ),
+        CircuitBreakerLevel.LEVEL_4: CircuitBreakerAction(
+            reduce_positions_pct=Decimal("1.00"),
+            pause_new_entries=True,
+            close_directional=True,
+            full_liquidation=True,
+            dual_auth_required=True,
+        ),
     }
 
+    # Default risk rules, already in priority order (lower = checked first):
+    # (name, check method, priority, is_blocking)
+    _DEFAULT_RULES = (
+        ("emergency_stop", "_check_emergency_stop", 1, True),
+        ("circuit_breaker", "_check_circuit_breaker_rule", 2, True),
+        # Loss limits trip the emergency stop, so they run on every signal
+        ("daily_loss_limit", "_check_daily_loss_limit", 3, True),
+        ("weekly_loss_limit", "_check_weekly_loss_limit", 4, True),
+        # Cheapest rejections next, ahead of the Decimal-heavy rules
+        ("signal_confidence", "_check_signal_confidence", 5, True),
+        ("duplicate_position", "_check_duplicate_position", 6, True),
+        ("max_concurrent_positions", "_check_max_concurrent_positions", 7, True),
+        ("max_position_size", "_check_max_position_size", 8, True),
+        # Warning only, doesn't block
+        ("correlation_crisis", "_check_correlation_crisis", 9, False),
+    )
+
     # Risk configuration constants
     KELLY_FRACTION = Decimal("0.125")  # 1/8 Kelly for safety
     MAX_LEVERAGE_TREND = Decimal("2.0")
@@ -170,6 +243,17 @@ class RiskManager:
     DEFAULT_RISK_PER_TRADE = Decimal("0.01")  # 1% risk per trade
     CORRELATION_CRISIS_THRESHOLD = Decimal("0.90")
     MIN_SIGNAL_CONFIDENCE = Decimal("0.60")
+    # Confidence is a float score, not money; compare it as one
+    _MIN_SIGNAL_CONFIDENCE_FLOAT = float(MIN_SIGNAL_CONFIDENCE)
+
+    # Maximum leverage by lowercase strategy type
+    _LEVERAGE_BY_STRATEGY = {
+        "core": MAX_LEVERAGE_CORE,
+        "trend": MAX_LEVERAGE_TREND,
+        "funding": MAX_LEVERAGE_FUNDING,
+        "tactical": MAX_LEVERAGE_TACTICAL,
+    }
+    _DEFAULT_LEVERAGE = Decimal("1.0")
 
     def __init__(self):
         # PnL tracking
@@ -188,88 +272,58 @@ class RiskManager:
 
         # Circuit breaker state
         self.circuit_breaker = CircuitBreaker()
-        self.circuit_breaker_history: List[Dict] = []
+        # Most recent activations and resets; older entries drop off
+        self.circuit_breaker_history: Deque[Dict] = deque(maxlen=1000)
 
         # Risk rules registry
         self._risk_rules: List[RiskRule] = []
         self._register_default_rules()
 
         # Tracking
-        self.rejected_signals: List[Dict] = []
+        # Most recent rejections; older entries drop off
+        self.rejected_signals: Deque[Dict] = deque(maxlen=1000)
         self.position_correlations: Dict[str, Decimal] = {}
 
         # Position sizing settings
         self.sizing_method = PositionSizingMethod.RISK_BASED
 
+        # Limits from trading_config, bound once (see reload_config)
+        self.reload_config()
+
+    def reload_config(self):
+        """Re-read risk limits from trading_config.
+
+        Limits are converted to Decimal here rather than on every check;
+        call this after changing trading_config at runtime.
+        """
+        # Loss limits are stored as decimals (0.02 = 2%) and compared as
+        # percentages (2.0), with the warning level at 80% of the limit
+        self._max_daily_loss_pct = Decimal(str(trading_config.max_daily_loss_pct)) * 100
+        self._daily_loss_warning_pct = self._max_daily_loss_pct * Decimal("0.8")
+        self._max_weekly_loss_pct = (
+            Decimal(str(trading_config.max_weekly_loss_pct)) * 100
+        )
+        self._weekly_loss_warning_pct = self._max_weekly_loss_pct * Decimal("0.8")
+        self._max_position_pct = Decimal(str(trading_config.max_position_pct))
+        # Share of the portfolio used by position sizing
+        self._max_position_fraction = self._max_position_pct / 100
+        self._max_concurrent_positions = int(trading_config.max_concurrent_positions)
+        self._stop_loss_pct = Decimal(str(trading_config.stop_loss_pct)) / 100
+        # Price multipliers for the unwidened percentage stop
+        self._long_stop_mult = _ONE - self._stop_loss_pct
+        self._short_stop_mult = _ONE + self._stop_loss_pct
+
     def _register_default_rules(self):
         """Register the default set of risk rules in priority order."""
         self._risk_rules = [
-            # Priority 1: Emergency stop check (highest priority, blocking)
-            RiskRule(
-                name="emergency_stop",
-                check_fn=self._check_emergency_stop,
-                priority=1,
-                is_blocking=True,
-            ),
-            # Priority 2: Circuit breaker check
-            RiskRule(
-                name="circuit_breaker",
-                check_fn=self._check_circuit_breaker_rule,
-                priority=2,
-                is_blocking=True,
-            ),
-            # Priority 3: Daily loss limit
-            RiskRule(
-                name="daily_loss_limit",
-                check_fn=self._check_daily_loss_limit,
-                priority=3,
-                is_blocking=True,
-            ),
-            # Priority 4: Weekly loss limit
             RiskRule(
-                name="weekly_loss_limit",
-                check_fn=self._check_weekly_loss_limit,
-                priority=4,
-                is_blocking=True,
-            ),
-            # Priority 5: Maximum position size
-            RiskRule(
-                name="max_position_size",
-                check_fn=self._check_max_position_size,
-                priority=5,
-                is_blocking=True,
-            ),
-            # Priority 6: Maximum concurrent positions
-            RiskRule(
-                name="max_concurrent_positions",
-                check_fn=self._check_max_concurrent_positions,
-                priority=6,
-                is_blocking=True,
-            ),
-            # Priority 7: Correlation crisis check
-            RiskRule(
-                name="correlation_crisis",
-                check_fn=self._check_correlation_crisis,
-                priority=7,
-                is_blocking=False,  # Warning only, doesn't block
-            ),
-            # Priority 8: Signal confidence check
-            RiskRule(
-                name="signal_confidence",
-                check_fn=self._check_signal_confidence,
-                priority=8,
-                is_blocking=True,
-            ),
-            # Priority 9: Duplicate position check
-            RiskRule(
-                name="duplicate_position",
-                check_fn=self._check_duplicate_position,
-                priority=9,
-                is_blocking=True,
-            ),
+                name=name,
+                check_fn=getattr(self, method),
+                priority=priority,
+                is_blocking=is_blocking,
+            )
+            for name, method, priority, is_blocking in self._DEFAULT_RULES
         ]
-        # Sort by priority
-        self._risk_rules.sort(key=lambda r: r.priority)
 
     async def initialize(self, portfolio: Portfolio):
         """Initialize risk manager with current portfolio state."""
@@ -290,9 +344,15 @@ class RiskManager:
             kelly_fraction=float(self.KELLY_FRACTION),
         )
 
-    def reset_periods(self, portfolio: Portfolio):
-        """Reset daily/weekly tracking periods."""
-        now = datetime.now(timezone.utc)
+    def reset_periods(self, portfolio: Portfolio, now: Optional[datetime] = None):
+        """Reset daily/weekly tracking periods.
+
+        Args:
+            portfolio: Current portfolio state
+            now: Current UTC time, if the caller already has it
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
 
         # Reset daily
         if self.last_reset_day:
@@ -345,8 +405,11 @@ class RiskManager:
         Returns:
             RiskCheck indicating if signal can be executed
         """
+        # One clock read for the period reset and any rejection record
+        now = datetime.now(timezone.utc)
+
         # Reset periods if needed
-        self.reset_periods(portfolio)
+        self.reset_periods(portfolio, now)
 
         # Update all-time high
         if (
@@ -357,7 +420,7 @@ class RiskManager:
             logger.info("risk_manager.new_ath", balance=str(self.all_time_high_balance))
 
         # Check circuit breakers first
-        self._check_circuit_breakers(portfolio)
+        self.check_circuit_breakers(portfolio)
 
         # Evaluate all risk rules in priority order
         warnings = []
@@ -367,16 +430,18 @@ class RiskManager:
 
                 if not result.passed:
                     # Log rejection
-                    self._log_signal_rejected(signal, rule.name, result.reason)
+                    self._log_signal_rejected(signal, rule.name, result.reason, now)
 
                     if rule.is_blocking:
-                        logger.warning(
-                            "risk_manager.signal_rejected_blocking",
-                            symbol=signal.symbol,
-                            rule=rule.name,
-                            reason=result.reason,
-                            priority=rule.priority,
-                        )
+                        # Rejections flood in while trading is halted
+                        if _std_logger.isEnabledFor(logging.WARNING):
+                            logger.warning(
+                                "risk_manager.signal_rejected_blocking",
+                                symbol=signal.symbol,
+                                rule=rule.name,
+                                reason=result.reason,
+                                priority=rule.priority,
+                            )
                         return RiskCheck(
                             passed=False,
                             reason=result.reason,
@@ -448,7 +513,7 @@ class RiskManager:
                     )
                 },
             )
-        return RiskCheck(passed=True)
+        return _PASSED
 
     def _check_circuit_breaker_rule(
         self,
@@ -495,7 +560,7 @@ class RiskManager:
                 metadata={"level": cb.level.value},
             )
 
-        return RiskCheck(passed=True)
+        return _PASSED
 
     def _check_daily_loss_limit(
         self,
@@ -510,8 +575,7 @@ class RiskManager:
         so we convert it to percentage for comparison.
         """
         daily_loss_pct = self._calculate_daily_loss_pct(portfolio)
-        # Config stores as decimal (0.02 = 2%), convert to percentage (2.0)
-        max_daily_loss_pct = Decimal(str(trading_config.max_daily_loss_pct)) * 100
+        max_daily_loss_pct = self._max_daily_loss_pct
 
         # Validate daily_starting_balance is properly initialized
         if not self.daily_starting_balance or self.daily_starting_balance <= 0:
@@ -520,7 +584,7 @@ class RiskManager:
                 reason="daily_starting_balance not initialized",
                 balance=str(self.daily_starting_balance),
             )
-            return RiskCheck(passed=True)
+            return _PASSED
 
         # Emergency stop at 100% of limit
         if daily_loss_pct >= max_daily_loss_pct:
@@ -538,7 +602,7 @@ class RiskManager:
             )
 
         # Warning at 80% of limit
-        if daily_loss_pct >= max_daily_loss_pct * Decimal("0.8"):
+        if daily_loss_pct >= self._daily_loss_warning_pct:
             return RiskCheck(
                 passed=True,
                 reason=f"Daily loss at {daily_loss_pct:.2f}% - approaching limit",
@@ -549,7 +613,7 @@ class RiskManager:
                 },
             )
 
-        return RiskCheck(passed=True)
+        return _PASSED
 
     def _check_weekly_loss_limit(
         self,
@@ -564,8 +628,7 @@ class RiskManager:
         so we convert it to percentage for comparison.
         """
         weekly_loss_pct = self._calculate_weekly_loss_pct(portfolio)
-        # Config stores as decimal (0.05 = 5%), convert to percentage (5.0)
-        max_weekly_loss_pct = Decimal(str(trading_config.max_weekly_loss_pct)) * 100
+        max_weekly_loss_pct = self._max_weekly_loss_pct
 
         # Validate weekly_starting_balance is properly initialized
         if not self.weekly_starting_balance or self.weekly_starting_balance <= 0:
@@ -574,7 +637,7 @@ class RiskManager:
                 reason="weekly_starting_balance not initialized",
                 balance=str(self.weekly_starting_balance),
             )
-            return RiskCheck(passed=True)
+            return _PASSED
 
         # Emergency stop at 100% of limit
         if weekly_loss_pct >= max_weekly_loss_pct:
@@ -592,7 +655,7 @@ class RiskManager:
             )
 
         # Warning at 80% of limit
-        if weekly_loss_pct >= max_weekly_loss_pct * Decimal("0.8"):
+        if weekly_loss_pct >= self._weekly_loss_warning_pct:
             return RiskCheck(
                 passed=True,
                 reason=f"Weekly loss at {weekly_loss_pct:.2f}% - approaching limit",
@@ -603,7 +666,7 @@ class RiskManager:
                 },
             )
 
-        return RiskCheck(passed=True)
+        return _PASSED
 
     def _check_max_position_size(
         self,
@@ -618,9 +681,9 @@ class RiskManager:
             portfolio_pct = (
                 position_value / portfolio.total_balance * 100
                 if portfolio.total_balance > 0
-                else Decimal("0")
+                else _ZERO
             )
-            max_pct = Decimal(str(trading_config.max_position_pct))
+            max_pct = self._max_position_pct
 
             if portfolio_pct >= max_pct:
                 return RiskCheck(
@@ -633,7 +696,7 @@ class RiskManager:
                     },
                 )
 
-        return RiskCheck(passed=True)
+        return _PASSED
 
     def _check_max_concurrent_positions(
         self,
@@ -642,10 +705,9 @@ class RiskManager:
         current_positions: Dict[str, Position],
     ) -> RiskCheck:
         """Check if maximum concurrent positions would be exceeded."""
-        open_positions = len(
-            [p for p in current_positions.values() if p.side != PositionSide.NONE]
-        )
-        max_positions = trading_config.max_concurrent_positions
+        none = PositionSide.NONE
+        open_positions = sum(1 for p in current_positions.values() if p.side != none)
+        max_positions = self._max_concurrent_positions
 
         if open_positions >= max_positions:
             return RiskCheck(
@@ -655,7 +717,7 @@ class RiskManager:
                 metadata={"current": open_positions, "max": max_positions},
             )
 
-        return RiskCheck(passed=True)
+        return _PASSED
 
     def _check_correlation_crisis(
         self,
@@ -665,7 +727,7 @@ class RiskManager:
     ) -> RiskCheck:
         """Check if we're in a correlation crisis (all assets moving together)."""
         if len(current_positions) < 2:
-            return RiskCheck(passed=True)
+            return _PASSED
 
         # Calculate average correlation between positions
         # In a real implementation, this would use historical price data
@@ -683,7 +745,7 @@ class RiskManager:
                 },
             )
 
-        return RiskCheck(passed=True)
+        return _PASSED
 
     def _check_signal_confidence(
         self,
@@ -692,9 +754,8 @@ class RiskManager:
         current_positions: Dict[str, Position],
     ) -> RiskCheck:
         """Check if signal confidence meets minimum threshold."""
-        confidence = Decimal(str(signal.confidence))
-
-        if confidence < self.MIN_SIGNAL_CONFIDENCE:
+        if signal.confidence < self._MIN_SIGNAL_CONFIDENCE_FLOAT:
+            confidence = Decimal(str(signal.confidence))
             return RiskCheck(
                 passed=False,
                 reason=f"Signal confidence {confidence:.2f} below minimum {self.MIN_SIGNAL_CONFIDENCE}",
@@ -705,7 +766,7 @@ class RiskManager:
                 },
             )
 
-        return RiskCheck(passed=True)
+        return _PASSED
 
     def _check_duplicate_position(
         self,
@@ -752,7 +813,7 @@ class RiskManager:
                     },
                 )
 
-        return RiskCheck(passed=True)
+        return _PASSED
 
     # === Circuit Breaker Methods ===
 
@@ -772,14 +833,13 @@ class RiskManager:
         current_drawdown = self._calculate_drawdown(portfolio)
         previous_level = self.circuit_breaker.level
 
-        # Determine appropriate level
-        new_level = CircuitBreakerLevel.NONE
-        for level, threshold in sorted(
-            self.CIRCUIT_BREAKER_LEVELS.items(), key=lambda x: x[1], reverse=True
-        ):
-            if current_drawdown >= threshold:
-                new_level = level
-                break
+        # Determine appropriate level: the highest threshold reached
+        index = bisect_right(self._CIRCUIT_BREAKER_THRESHOLDS, current_drawdown)
+        new_level = (
+            self._CIRCUIT_BREAKER_ORDER[index - 1]
+            if index
+            else CircuitBreakerLevel.NONE
+        )
 
         # If level changed, trigger actions
         if new_level != previous_level and new_level != CircuitBreakerLevel.NONE:
@@ -789,7 +849,7 @@ class RiskManager:
         if self.circuit_breaker.level == CircuitBreakerLevel.LEVEL_1:
             recovery_threshold = self.CIRCUIT_BREAKER_ACTIONS[
                 CircuitBreakerLevel.LEVEL_1
-            ]["auto_recovery_drawdown"]
+            ].auto_recovery_drawdown
             if current_drawdown <= recovery_threshold:
                 self.reset_circuit_breaker()
                 logger.info(
@@ -800,16 +860,12 @@ class RiskManager:
 
         return self.circuit_breaker.level
 
-    def _check_circuit_breakers(self, portfolio: Portfolio) -> CircuitBreakerLevel:
-        """Alias for check_circuit_breakers for internal use."""
-        return self.check_circuit_breakers(portfolio)
-
     def _activate_circuit_breaker(
         self, level: CircuitBreakerLevel, drawdown: Decimal, portfolio: Portfolio
     ):
         """Activate a circuit breaker level with appropriate actions."""
         now = datetime.now(timezone.utc)
-        actions = self.CIRCUIT_BREAKER_ACTIONS.get(level, {})
+        actions = self.CIRCUIT_BREAKER_ACTIONS.get(level, _NO_ACTION)
 
         # Record previous state
         self.circuit_breaker_history.append(
@@ -828,20 +884,16 @@ class RiskManager:
         self.circuit_breaker.triggered_by = f"Drawdown: {drawdown:.2%}"
 
         # Apply actions
-        self.circuit_breaker.reduce_positions_pct = actions.get(
-            "reduce_positions_pct", Decimal("0")
-        )
-        self.circuit_breaker.pause_new_entries = actions.get("pause_new_entries", False)
-        self.circuit_breaker.close_directional = actions.get("close_directional", False)
-        self.circuit_breaker.full_liquidation = actions.get("full_liquidation", False)
-        self.circuit_breaker.widen_stops_pct = actions.get(
-            "widen_stops_pct", Decimal("0")
-        )
+        self.circuit_breaker.reduce_positions_pct = actions.reduce_positions_pct
+        self.circuit_breaker.pause_new_entries = actions.pause_new_entries
+        self.circuit_breaker.close_directional = actions.close_directional
+        self.circuit_breaker.full_liquidation = actions.full_liquidation
+        self.circuit_breaker.widen_stops_pct = actions.widen_stops_pct
 
         # Set pause duration if applicable
-        if "pause_duration_hours" in actions:
+        if actions.pause_duration_hours is not None:
             self.circuit_breaker.pause_until = now + timedelta(
-                hours=actions["pause_duration_hours"]
+                hours=actions.pause_duration_hours
             )
 
         # Log critical event
@@ -850,7 +902,9 @@ class RiskManager:
             level=level.value,
             drawdown=float(drawdown),
             actions={
-                k: str(v) if isinstance(v, Decimal) else v for k, v in actions.items()
+                f.name: str(v) if isinstance(v, Decimal) else v
+                for f in fields(actions)
+                if (v := getattr(actions, f.name)) != f.default
             },
             portfolio_value=str(portfolio.total_balance),
         )
@@ -867,12 +921,10 @@ class RiskManager:
             True if reset was successful, False if manual authorization required
         """
         level = self.circuit_breaker.level
-        actions = self.CIRCUIT_BREAKER_ACTIONS.get(level, {})
+        actions = self.CIRCUIT_BREAKER_ACTIONS.get(level, _NO_ACTION)
 
         # Check if manual recovery is required
-        if actions.get("manual_recovery_required", False) or actions.get(
-            "dual_auth_required", False
-        ):
+        if actions.manual_recovery_required or actions.dual_auth_required:
             logger.warning(
                 "risk_manager.circuit_breaker_reset_blocked",
                 level=level.value,
@@ -930,9 +982,7 @@ class RiskManager:
             return Decimal("0")
 
         # Base calculations
-        max_position_value = portfolio.total_balance * (
-            Decimal(str(trading_config.max_position_pct)) / 100
-        )
+        max_position_value = portfolio.total_balance * self._max_position_fraction
 
         # Calculate risk-based size
         risk_per_trade = (
@@ -958,7 +1008,7 @@ class RiskManager:
 
         # Adjust for available balance (leave 5% buffer)
         position_value = min(
-            position_value, portfolio.available_balance * Decimal("0.95")
+            position_value, portfolio.available_balance * _AVAILABLE_BALANCE_BUFFER
         )
 
         # Apply leverage limits based on strategy type
@@ -979,18 +1029,19 @@ class RiskManager:
         quantity = position_value / entry_price
 
         # Round down to avoid over-sizing
-        quantity = quantity.quantize(Decimal("0.0001"), rounding=ROUND_DOWN)
-
-        logger.debug(
-            "risk_manager.position_size_calculated",
-            max_position_value=str(max_position_value),
-            entry_price=str(entry_price),
-            stop_loss=str(stop_loss_price) if stop_loss_price else None,
-            risk_pct=float(risk_per_trade),
-            strategy_type=strategy_type,
-            leverage=float(max_leverage),
-            quantity=str(quantity),
-        )
+        quantity = quantity.quantize(_QUANTITY_STEP, rounding=ROUND_DOWN)
+
+        if _std_logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "risk_manager.position_size_calculated",
+                max_position_value=str(max_position_value),
+                entry_price=str(entry_price),
+                stop_loss=str(stop_loss_price) if stop_loss_price else None,
+                risk_pct=float(risk_per_trade),
+                strategy_type=strategy_type,
+                leverage=float(max_leverage),
+                quantity=str(quantity),
+            )
 
         return quantity
 
@@ -1006,11 +1057,7 @@ class RiskManager:
         We use 1/8 Kelly for safety: f* = K% / 8
         """
         if win_rate <= 0 or avg_win_loss_ratio <= 0:
-            return (
-                portfolio.total_balance
-                * Decimal(str(trading_config.max_position_pct))
-                / 100
-            )
+            return portfolio.total_balance * self._max_position_fraction
 
         # Full Kelly fraction
         full_kelly = win_rate - ((Decimal("1") - win_rate) / avg_win_loss_ratio)
@@ -1022,20 +1069,20 @@ class RiskManager:
         kelly_fraction = max(kelly_fraction, Decimal("0"))
 
         # Cap at max position percentage
-        max_pct = Decimal(str(trading_config.max_position_pct)) / 100
+        max_pct = self._max_position_fraction
         kelly_fraction = min(kelly_fraction, max_pct)
 
         return portfolio.total_balance * kelly_fraction
 
     def _get_max_leverage(self, strategy_type: str) -> Decimal:
         """Get maximum leverage for a strategy type."""
-        leverage_map = {
-            "core": self.MAX_LEVERAGE_CORE,
-            "trend": self.MAX_LEVERAGE_TREND,
-            "funding": self.MAX_LEVERAGE_FUNDING,
-            "tactical": self.MAX_LEVERAGE_TACTICAL,
-        }
-        return leverage_map.get(strategy_type.lower(), Decimal("1.0"))
+        # Callers normally pass lowercase names; lower() only on a miss
+        leverage = self._LEVERAGE_BY_STRATEGY.get(strategy_type)
+        if leverage is None:
+            leverage = self._LEVERAGE_BY_STRATEGY.get(
+                strategy_type.lower(), self._DEFAULT_LEVERAGE
+            )
+        return leverage
 
     def calculate_stop_loss(
         self,
@@ -1057,31 +1104,36 @@ class RiskManager:
             Stop loss price
         """
         # Base stop percentage
-        stop_pct = Decimal(str(trading_config.stop_loss_pct)) / 100
+        stop_pct = self._stop_loss_pct
+        long_mult = self._long_stop_mult
+        short_mult = self._short_stop_mult
 
         # Add circuit breaker widening if active
         if self.circuit_breaker.widen_stops_pct > 0:
             stop_pct = stop_pct + self.circuit_breaker.widen_stops_pct
-            logger.debug(
-                "risk_manager.stop_loss_widened",
-                base_pct=float(Decimal(str(trading_config.stop_loss_pct)) / 100),
-                additional_pct=float(self.circuit_breaker.widen_stops_pct),
-                total_pct=float(stop_pct),
-            )
+            long_mult = _ONE - stop_pct
+            short_mult = _ONE + stop_pct
+            if _std_logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "risk_manager.stop_loss_widened",
+                    base_pct=float(self._stop_loss_pct),
+                    additional_pct=float(self.circuit_breaker.widen_stops_pct),
+                    total_pct=float(stop_pct),
+                )
 
         # If ATR provided, use volatility-based stop
         if atr is not None and atr > 0:
             stop_distance = atr * multiplier
             if side == "long":
-                return max(entry_price - stop_distance, entry_price * Decimal("0.5"))
+                return max(entry_price - stop_distance, entry_price * _ATR_STOP_FLOOR)
             else:
-                return min(entry_price + stop_distance, entry_price * Decimal("1.5"))
+                return min(entry_price + stop_distance, entry_price * _ATR_STOP_CEILING)
 
         # Percentage-based stop
         if side == "long":
-            return entry_price * (Decimal("1") - stop_pct)
+            return entry_price * long_mult
         else:
-            return entry_price * (Decimal("1") + stop_pct)
+            return entry_price * short_mult
 
     def calculate_take_profit(
         self,
@@ -1100,13 +1152,13 @@ class RiskManager:
         Returns:
             Take profit price
         """
-        stop_pct = Decimal(str(trading_config.stop_loss_pct)) / 100
+        stop_pct = self._stop_loss_pct
         tp_pct = stop_pct * risk_reward_ratio
 
         if side == "long":
-            return entry_price * (Decimal("1") + tp_pct)
+            return entry_price * (_ONE + tp_pct)
         else:
-            return entry_price * (Decimal("1") - tp_pct)
+            return entry_price * (_ONE - tp_pct)
 
     # === Utility Methods ===
 
@@ -1250,18 +1302,18 @@ class RiskManager:
         Positive value indicates loss, 0 means no loss or profit.
         """
         if not self.daily_starting_balance or self.daily_starting_balance <= 0:
-            return Decimal("0")
+            return _ZERO
 
         # Skip if portfolio balance is not properly initialized
         if not portfolio.total_balance or portfolio.total_balance <= 0:
-            return Decimal("0")
+            return _ZERO
 
         current_pnl = portfolio.total_balance - self.daily_starting_balance
         if current_pnl < 0:
             # Calculate percentage loss (e.g., 0.12 for 0.12% loss)
             loss_pct = abs(current_pnl) / self.daily_starting_balance * 100
             return loss_pct
-        return Decimal("0")
+        return _ZERO
 
     def _calculate_weekly_loss_pct(self, portfolio: Portfolio) -> Decimal:
         """Calculate current weekly loss percentage.
@@ -1270,25 +1322,25 @@ class RiskManager:
         Positive value indicates loss, 0 means no loss or profit.
         """
         if not self.weekly_starting_balance or self.weekly_starting_balance <= 0:
-            return Decimal("0")
+            return _ZERO
 
         # Skip if portfolio balance is not properly initialized
         if not portfolio.total_balance or portfolio.total_balance <= 0:
-            return Decimal("0")
+            return _ZERO
 
         current_pnl = portfolio.total_balance - self.weekly_starting_balance
         if current_pnl < 0:
             # Calculate percentage loss (e.g., 0.12 for 0.12% loss)
             loss_pct = abs(current_pnl) / self.weekly_starting_balance * 100
             return loss_pct
-        return Decimal("0")
+        return _ZERO
 
     def _calculate_drawdown(self, portfolio: Portfolio) -> Optional[Decimal]:
         """Calculate current drawdown from all-time high."""
         if not self.all_time_high_balance or self.all_time_high_balance == 0:
             return None
         if portfolio.total_balance >= self.all_time_high_balance:
-            return Decimal("0")
+            return _ZERO
         return (
             self.all_time_high_balance - portfolio.total_balance
         ) / self.all_time_high_balance
@@ -1298,14 +1350,14 @@ class RiskManager:
     ) -> Decimal:
         """Estimate average correlation between positions (simplified)."""
         if len(current_positions) < 2:
-            return Decimal("0")
+            return _ZERO
 
         # Simplified correlation estimation based on P&L direction
         # In production, this would use actual price correlation matrices
         pnls = [p.unrealized_pnl for p in current_positions.values()]
 
         if len(pnls) < 2:
-            return Decimal("0")
+            return _ZERO
 
         # Check if all P&Ls are in same direction (high correlation indicator)
         positive_pnls = sum(1 for pnl in pnls if pnl > 0)
@@ -1319,10 +1371,16 @@ class RiskManager:
 
         return correlation
 
-    def _log_signal_rejected(self, signal: TradingSignal, rule: str, reason: str):
+    def _log_signal_rejected(
+        self,
+        signal: TradingSignal,
+        rule: str,
+        reason: str,
+        now: Optional[datetime] = None,
+    ):
         """Log a rejected signal for analysis."""
         rejection = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": (now or datetime.now(timezone.utc)).isoformat(),
             "symbol": signal.symbol,
             "signal_type": signal.signal_type.value,
             "strategy": signal.strategy_name,
@@ -1332,10 +1390,6 @@ class RiskManager:
         }
         self.rejected_signals.append(rejection)
 
-        # Keep only last 1000 rejections
-        if len(self.rejected_signals) > 1000:
-            self.rejected_signals = self.rejected_signals[-1000:]
-
 
 # === Convenience Functions ===
 
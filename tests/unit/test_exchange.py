@@ -1,4 +1,5 @@
 """Unit tests for Bybit exchange client."""
+import asyncio
 import pytest
 import pytest_asyncio
 from decimal import Decimal
@@ -7,15 +8,23 @@ from unittest.mock import AsyncMock, MagicMock, patch, ANY
 
 import ccxt.async_support as ccxt
 
+from src.exchange import bybit_client
+from src.exchange.bybit_demo_http import BybitDemoAsyncHTTP, sign_request
 from src.exchange.bybit_client import (
-    ByBitClient, SubAccountType, SubAccountConfig,
+    ByBitClient, PybitDemoClient, SubAccountType, SubAccountConfig,
     RetryConfig, with_retry
 )
 from src.core.models import (
     Order, OrderSide, OrderType, OrderStatus,
     Position, PositionSide, Portfolio, MarketData
 )
-from src.core.config import trading_config
+
+
+@pytest.fixture(autouse=True)
+def markets_cache_dir(tmp_path, monkeypatch):
+    """Keep persisted markets metadata out of the working tree."""
+    monkeypatch.setattr(ByBitClient, "MARKETS_DISK_CACHE_DIR", tmp_path)
+    return tmp_path
 
 
 # =============================================================================
@@ -109,6 +118,18 @@ class TestSubAccountConfig:
         assert config.default_market == "linear"
         assert config.max_leverage == 2.0
     
+    def test_subaccount_config_from_profile(self):
+        """Test SubAccountConfig.from_profile uses the given credentials."""
+        config = SubAccountConfig.from_profile(
+            SubAccountType.FUNDING, "snap_key", "snap_secret"
+        )
+        
+        assert config.name == "FUNDING"
+        assert config.api_key == "snap_key"
+        assert config.api_secret == "snap_secret"
+        assert config.default_market == "linear"
+        assert config.max_leverage == 2.0
+    
     def test_subaccount_config_from_env_tactical(self, monkeypatch):
         """Test SubAccountConfig.from_env for TACTICAL subaccount."""
         from src.core import config as config_module
@@ -243,6 +264,346 @@ class TestByBitClient:
             assert client.configs == {}
             assert client._initialized is False
     
+    @pytest.mark.asyncio
+    async def test_initialize_keeps_successful_subaccounts(self, client):
+        """Test that one failing subaccount doesn't discard the others."""
+        async def fake_init(subaccount_type, testnet, credentials=None):
+            if subaccount_type == SubAccountType.TREND:
+                raise ccxt.ExchangeNotAvailable("TREND down")
+            client.exchanges[subaccount_type.value] = AsyncMock()
+        
+        with patch.object(client, "_initialize_subaccount", side_effect=fake_init):
+            await client.initialize(
+                [SubAccountType.MASTER, SubAccountType.TREND], testnet=True
+            )
+        
+        assert "MASTER" in client.exchanges
+        assert "TREND" not in client.exchanges
+        assert client.initialized is True
+    
+    @pytest.mark.asyncio
+    async def test_initialize_raises_when_all_subaccounts_fail(self, client):
+        """Test that initialization raises if no subaccount could be initialized."""
+        with patch.object(
+            client, "_initialize_subaccount",
+            side_effect=ccxt.ExchangeNotAvailable("down")
+        ):
+            with pytest.raises(ccxt.ExchangeNotAvailable):
+                await client.initialize(
+                    [SubAccountType.MASTER, SubAccountType.TREND], testnet=True
+                )
+        
+        assert client.initialized is False
+    
+    @pytest.mark.asyncio
+    async def test_markets_loaded_once_and_shared(self, client):
+        """Test subaccounts reuse the first markets load until the TTL expires."""
+        markets = {"BTC/USDT": {"id": "BTCUSDT"}}
+        first = MagicMock(id="bybit", markets=None, options={"defaultType": "spot"})
+        first.load_markets = AsyncMock(return_value=markets)
+        # A linear subaccount shares the load: ccxt fetches every category
+        second = MagicMock(id="bybit", markets=None, options={"defaultType": "linear"})
+        second.load_markets = AsyncMock(return_value=markets)
+        
+        assert await client._get_markets(first) is markets
+        assert await client._get_markets(second) is markets
+        
+        first.load_markets.assert_called_once_with(reload=False)
+        second.load_markets.assert_not_called()
+        second.set_markets.assert_called_once_with(markets)
+    
+    @pytest.mark.asyncio
+    async def test_subaccounts_share_http_session(self, client):
+        """Test every subaccount exchange uses one pooled session."""
+        client._get_markets = AsyncMock()
+        config = SubAccountConfig.from_profile(SubAccountType.TREND, "key", "secret")
+        
+        with patch('ccxt.async_support.bybit') as mock_ccxt:
+            mock_ccxt.return_value = AsyncMock()
+            await client._initialize_ccxt_subaccount(SubAccountType.TREND, config, True)
+            await client._initialize_ccxt_subaccount(SubAccountType.FUNDING, config, True)
+        
+        sessions = [c.args[0]["session"] for c in mock_ccxt.call_args_list]
+        assert sessions[0] is sessions[1] is client._http_session
+        assert sessions[0].connector.limit == ByBitClient.HTTP_POOL_SIZE
+        
+        await client.close()
+        
+        assert sessions[0].closed
+    
+    @pytest.mark.asyncio
+    async def test_markets_restored_from_disk(self, client):
+        """Test a fresh client reuses markets persisted by a previous one."""
+        markets = {"BTC/USDT": {"id": "BTCUSDT", "symbol": "BTC/USDT"}}
+        first = MagicMock(id="bybit", markets=None, isSandboxModeEnabled=True)
+        first.load_markets = AsyncMock(return_value=markets)
+        await client._get_markets(first)
+        
+        restarted = ByBitClient()
+        exchange = MagicMock(id="bybit", markets=None, isSandboxModeEnabled=True)
+        exchange.load_markets = AsyncMock()
+        await restarted._get_markets(exchange)
+        
+        exchange.load_markets.assert_not_called()
+        exchange.set_markets.assert_called_once_with(markets)
+        
+        await restarted._invalidate_markets(exchange)
+        assert not restarted._markets_cache_path(exchange).exists()
+    
+    @pytest.mark.asyncio
+    async def test_markets_reloaded_after_invalidation(self, client):
+        """Test invalidated markets are reloaded from the exchange."""
+        exchange = MagicMock(id="bybit", markets=None)
+        exchange.load_markets = AsyncMock(return_value={})
+        
+        await client._get_markets(exchange)
+        await client._invalidate_markets(exchange)
+        await client._get_markets(exchange)
+        
+        assert exchange.load_markets.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_fetch_ohlcv_many(self, client):
+        """Test OHLCV for several symbols is fetched with bounded concurrency."""
+        exchange = AsyncMock()
+        exchange.options = {"defaultType": "spot"}
+        exchange.markets_by_id = {"BTCUSDT": [
+            {"symbol": "BTC/USDT", "spot": True, "linear": False},
+            {"symbol": "BTC/USDT:USDT", "spot": False, "linear": True},
+        ]}
+        requested = []
+        in_flight = 0
+        peak = 0
+        
+        async def fake_fetch_ohlcv(symbol, timeframe, limit):
+            nonlocal in_flight, peak
+            requested.append(symbol)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if symbol == "BADUSDT":
+                raise ccxt.BadRequest("unknown symbol")
+            return [[1700000000000, 1, 2, 0.5, 1.5, 10]]
+        
+        exchange.fetch_ohlcv = fake_fetch_ohlcv
+        client.exchanges["TREND"] = exchange
+        client._get_markets = AsyncMock()
+        
+        result = await client.fetch_ohlcv_many(
+            ["BTCUSDT", "ETHUSDT", "SOLUSDT", "BADUSDT"],
+            market_type="linear",
+            max_concurrency=2,
+        )
+        
+        assert sorted(result) == ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+        assert result["BTCUSDT"][0].close == Decimal("1.5")
+        assert result["BTCUSDT"][0].timestamp == datetime(2023, 11, 14, 22, 13, 20)
+        assert peak == 2
+        assert "BTC/USDT:USDT" in requested
+        assert exchange.options["defaultType"] == "spot"
+    
+    @pytest.mark.asyncio
+    async def test_fetch_ohlcv_raw(self, client):
+        """Test raw OHLCV comes back as an (N, 6) float array."""
+        exchange = AsyncMock()
+        exchange.markets_by_id = {}
+        exchange.fetch_ohlcv.return_value = [
+            [1700000000000, 1, 2, 0.5, 1.5, 10],
+            [1700003600000, 1.5, 3, 1, 2.5, 20],
+        ]
+        client.exchanges["MASTER"] = exchange
+        client._get_markets = AsyncMock()
+        
+        raw = await client.fetch_ohlcv_raw("BTCUSDT", limit=2)
+        
+        assert raw.shape == (2, 6)
+        assert raw.dtype.name == "float64"
+        assert raw[1, 0] == 1700003600000
+        assert raw[1, 4] == 2.5
+        
+        exchange.fetch_ohlcv.return_value = []
+        assert (await client.fetch_ohlcv_raw("BTCUSDT")).shape == (0, 6)
+    
+    @pytest.mark.asyncio
+    async def test_subscribed_ticker_served_from_stream(self, client):
+        """Test streamed tickers skip REST and feed the price callbacks."""
+        rest_exchange = AsyncMock()
+        client.exchanges["MASTER"] = rest_exchange
+        
+        pushes = asyncio.Queue()
+        ws_exchange = AsyncMock()
+        ws_exchange.watch_ticker = lambda symbol: pushes.get()
+        client._ws_exchange = ws_exchange
+        prices = []
+        client.register_price_callback(lambda symbol, price: prices.append((symbol, price)))
+        
+        await client.subscribe_tickers(["BTCUSDT"])
+        await pushes.put({"last": 50000, "bid": 49999, "ask": 50001, "timestamp": 1})
+        for _ in range(3):
+            await asyncio.sleep(0)
+        
+        ticker = await client.fetch_ticker("BTCUSDT")
+        
+        assert ticker["last"] == Decimal("50000")
+        rest_exchange.fetch_ticker.assert_not_awaited()
+        assert prices == [("BTCUSDT", Decimal("50000"))]
+        
+        await client.close()
+        
+        assert client._ticker_tasks == {}
+        ws_exchange.close.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_order_stream_feeds_order_callbacks(self, client):
+        """Test streamed order updates reach the order callbacks as Orders."""
+        client.exchanges["TREND"] = AsyncMock()
+        client.configs["TREND"] = SubAccountConfig.from_profile(
+            SubAccountType.TREND, "key", "secret"
+        )
+        client.exchanges["DEMO"] = PybitDemoClient("key", "secret")
+        pushes = asyncio.Queue()
+        stream = AsyncMock()
+        stream.watch_orders = lambda: pushes.get()
+        received = []
+        client.register_order_callback(received.append)
+        
+        with patch.object(bybit_client.ccxtpro, "bybit", return_value=stream):
+            await client.subscribe_orders()
+        await pushes.put([{
+            'id': 'order123', 'symbol': 'BTCUSDT', 'side': 'buy', 'type': 'limit',
+            'amount': 0.1, 'price': 49000, 'status': 'closed', 'filled': 0.1,
+            'average': 49000,
+        }])
+        for _ in range(3):
+            await asyncio.sleep(0)
+        
+        assert list(client._order_tasks) == ["TREND"]
+        assert [o.status for o in received] == [OrderStatus.FILLED]
+        assert received[0].metadata == {"subaccount": "TREND"}
+        
+        await client.close()
+        
+        stream.close.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_open_orders_cached_follows_order_stream(self, client):
+        """Test the streamed open-order book answers without a REST call."""
+        exchange = AsyncMock()
+        exchange.fetch_open_orders = AsyncMock(return_value=[{
+            'id': 'order123', 'symbol': 'BTC/USDT:USDT', 'side': 'buy', 'type': 'limit',
+            'amount': 0.1, 'price': 49000, 'status': 'open', 'filled': 0,
+            'average': None,
+        }])
+        client.exchanges["TREND"] = exchange
+        client.configs["TREND"] = SubAccountConfig.from_profile(
+            SubAccountType.TREND, "key", "secret"
+        )
+        pushes = asyncio.Queue()
+        stream = AsyncMock()
+        stream.watch_orders = lambda: pushes.get()
+        
+        with patch.object(bybit_client.ccxtpro, "bybit", return_value=stream):
+            await client.subscribe_orders()
+        with patch.object(client, '_paper', False):
+            first = await client.get_open_orders_cached("TREND", "BTCUSDT")
+            await pushes.put([{
+                'id': 'order123', 'symbol': 'BTC/USDT:USDT', 'side': 'buy',
+                'type': 'limit', 'amount': 0.1, 'price': 49000, 'status': 'closed',
+                'filled': 0.1, 'average': 49000,
+            }])
+            for _ in range(3):
+                await asyncio.sleep(0)
+            second = await client.get_open_orders_cached("TREND")
+        await client.close()
+        
+        assert [o.exchange_order_id for o in first] == ["order123"]
+        assert second == []
+        exchange.fetch_open_orders.assert_awaited_once_with(None)
+
+    @pytest.mark.asyncio
+    async def test_get_open_orders_swallows_non_ccxt_errors(self, client):
+        """Test unparseable orders return no orders; unknown subaccounts raise."""
+        exchange = AsyncMock()
+        exchange.fetch_open_orders = AsyncMock(return_value=[{
+            'id': 'order123', 'symbol': 'BTCUSDT', 'side': 'sideways',
+            'type': 'limit', 'amount': 0.1, 'price': 49000, 'status': 'open',
+            'filled': 0, 'average': None,
+        }])
+        client.exchanges["TREND"] = exchange
+
+        with patch.object(client, '_paper', False):
+            with pytest.raises(ValueError, match="not initialized"):
+                await client.get_open_orders("NOPE")
+            unparseable = await client.get_open_orders("TREND")
+
+        assert unparseable == []
+
+    @pytest.mark.asyncio
+    async def test_stale_streamed_ticker_falls_back_to_rest(self, client):
+        """Test a ticker older than TICKER_MAX_AGE is fetched over REST."""
+        rest_exchange = AsyncMock()
+        rest_exchange.fetch_ticker.return_value = {
+            "last": 51000, "bid": 50999, "ask": 51001, "timestamp": 2
+        }
+        client.exchanges["MASTER"] = rest_exchange
+        client._ticker_cache["BTCUSDT"] = (
+            bybit_client.time.monotonic() - client.TICKER_MAX_AGE - 1,
+            {"last": 50000, "bid": 49999, "ask": 50001, "timestamp": 1},
+        )
+        
+        ticker = await client.fetch_ticker("BTCUSDT")
+        
+        assert ticker["last"] == Decimal("51000")
+        rest_exchange.fetch_ticker.assert_awaited_once_with("BTCUSDT")
+    
+    def test_order_from_ccxt(self, client):
+        """Test a ccxt open order converts to an Order."""
+        order = client._order_from_ccxt({
+            'id': 'order123', 'symbol': 'BTCUSDT', 'side': 'buy', 'type': 'limit',
+            'amount': 0.1, 'price': 49000, 'status': 'open', 'filled': 0,
+            'average': None,
+        }, "MASTER")
+        
+        assert order.exchange_order_id == "order123"
+        assert order.price == Decimal("49000")
+        assert order.average_price is None
+        assert order.status == OrderStatus.OPEN
+        assert order.metadata == {"subaccount": "MASTER"}
+    
+    def test_position_from_ccxt(self, client):
+        """Test ccxt positions convert to Position and flat ones are dropped."""
+        position = client._position_from_ccxt({
+            'symbol': 'BTC/USDT:USDT', 'contracts': 0.5, 'entryPrice': 50000,
+            'unrealizedPnl': 25, 'leverage': 2,
+        })
+        
+        assert position.amount == Decimal("0.5")
+        assert position.entry_price == Decimal("50000")
+        assert position.metadata["leverage"] == 2
+        assert client._position_from_ccxt({'contracts': 0}, "BTCUSDT") is None
+    
+    def test_price_to_decimal_memoized(self):
+        """Test price conversion is cached and keeps int/float forms apart."""
+        first = bybit_client._price_to_decimal(50000.5)
+        
+        assert first == Decimal("50000.5")
+        assert bybit_client._price_to_decimal(50000.5) is first
+        assert str(bybit_client._price_to_decimal(1)) == "1"
+        assert str(bybit_client._price_to_decimal(1.0)) == "1.0"
+    
+    def test_map_order_status(self, client):
+        """Test ccxt and Bybit statuses map to OrderStatus in any case."""
+        assert client._map_order_status("open") == OrderStatus.OPEN
+        assert client._map_order_status("NEW") == OrderStatus.OPEN
+        assert client._map_order_status("PARTIALLY_FILLED") == OrderStatus.PARTIALLY_FILLED
+        assert client._map_order_status("closed") == OrderStatus.FILLED
+        assert client._map_order_status("CANCELED") == OrderStatus.CANCELLED
+        assert client._map_order_status("cancelled") == OrderStatus.CANCELLED
+        assert client._map_order_status("EXPIRED") == OrderStatus.EXPIRED
+        assert client._map_order_status("bogus") == OrderStatus.PENDING
+        assert client._map_order_status(None) == OrderStatus.PENDING
+    
     @pytest.mark.asyncio
     async def test_get_exchange_raises_for_uninitialized(self, client):
         """Test that _get_exchange raises for uninitialized subaccount."""
@@ -312,12 +673,37 @@ class TestByBitClient:
         mock_exchange.fetch_balance = AsyncMock(return_value={
             'total': {'BTC': 0.5, 'ETH': 5.0, 'USDT': 1000}
         })
-        mock_exchange.fetch_ticker = AsyncMock(return_value={'last': 50000})
+        mock_exchange.fetch_tickers = AsyncMock(return_value={
+            'BTC/USDT': {'last': 50000},
+        })
         
         positions = await initialized_client.get_positions("MASTER")
         
-        # Should return positions for non-USDT holdings
-        assert len(positions) >= 0  # May be 0 if ticker fetch fails
+        # Should return positions for priced non-USDT holdings in one request
+        assert [p.symbol for p in positions] == ["BTCUSDT"]
+        assert positions[0].entry_price == Decimal("50000")
+        assert positions[0].amount == Decimal("0.5")
+        mock_exchange.fetch_tickers.assert_called_once_with(["BTC/USDT", "ETH/USDT"])
+    
+    @pytest.mark.asyncio
+    async def test_get_positions_spot_falls_back_to_all_tickers(self, client):
+        """Test an unlisted pair falls back to fetching every ticker."""
+        mock_exchange = AsyncMock()
+        client.exchanges["MASTER"] = mock_exchange
+        client.configs["MASTER"] = MagicMock(default_market="spot")
+        
+        mock_exchange.fetch_balance = AsyncMock(return_value={
+            'total': {'BTC': 0.5, 'DUST': 3.0}
+        })
+        mock_exchange.fetch_tickers = AsyncMock(side_effect=[
+            ccxt.BadSymbol("DUST/USDT"),
+            {'BTC/USDT': {'last': 50000}},
+        ])
+        
+        positions = await client.get_positions("MASTER")
+        
+        assert [p.symbol for p in positions] == ["BTCUSDT"]
+        assert mock_exchange.fetch_tickers.call_count == 2
     
     @pytest.mark.asyncio
     async def test_create_order_market(self, initialized_client):
@@ -333,7 +719,7 @@ class TestByBitClient:
         initialized_client.configs["MASTER"] = MagicMock()
         initialized_client.configs["MASTER"].is_read_only = False
         
-        with patch.object(trading_config, 'trading_mode', 'live'):
+        with patch.object(initialized_client, '_paper', False):
             order = await initialized_client.create_order(
                 subaccount="MASTER",
                 symbol="BTCUSDT",
@@ -369,7 +755,7 @@ class TestByBitClient:
         initialized_client.configs["MASTER"] = MagicMock()
         initialized_client.configs["MASTER"].is_read_only = False
         
-        with patch.object(trading_config, 'trading_mode', 'paper'):
+        with patch.object(initialized_client, '_paper', True):
             order = await initialized_client.create_order(
                 subaccount="MASTER",
                 symbol="BTCUSDT",
@@ -382,13 +768,50 @@ class TestByBitClient:
         assert order.status == OrderStatus.FILLED
         assert 'paper_trade' in order.metadata
     
+    @pytest.mark.asyncio
+    async def test_paper_order_with_price_skips_ticker(self, client):
+        """Test priced paper orders don't look up the market price."""
+        client.configs["MASTER"] = MagicMock(is_read_only=False)
+        client.fetch_ticker = AsyncMock()
+        
+        with patch.object(client, '_paper', True):
+            order = await client.create_order(
+                subaccount="MASTER",
+                symbol="BTCUSDT",
+                side=OrderSide.BUY,
+                order_type=OrderType.LIMIT,
+                amount=Decimal("0.1"),
+                price=Decimal("50000"),
+            )
+        
+        assert order.average_price == Decimal("50000")
+        client.fetch_ticker.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_create_orders_returns_results_in_order(self, client):
+        """Test create_orders runs every spec and keeps per-order failures."""
+        client.configs["MASTER"] = MagicMock(is_read_only=False)
+        client.fetch_ticker = AsyncMock(return_value={"last": Decimal("100")})
+        
+        with patch.object(client, '_paper', True):
+            results = await client.create_orders([
+                {"subaccount": "MASTER", "symbol": "BTCUSDT", "side": "buy",
+                 "order_type": "market", "amount": Decimal("1")},
+                {"subaccount": "MISSING", "symbol": "ETHUSDT", "side": "buy",
+                 "order_type": "market", "amount": Decimal("1")},
+            ])
+        
+        assert isinstance(results[0], Order)
+        assert results[0].average_price == Decimal("100")
+        assert isinstance(results[1], ValueError)
+    
     @pytest.mark.asyncio
     async def test_create_order_limit_requires_price(self, initialized_client):
         """Test that limit orders require a price."""
         initialized_client.configs["MASTER"] = MagicMock()
         initialized_client.configs["MASTER"].is_read_only = False
         
-        with patch.object(trading_config, 'trading_mode', 'live'):
+        with patch.object(initialized_client, '_paper', False):
             with pytest.raises(ValueError, match="Price is required"):
                 await initialized_client.create_order(
                     subaccount="MASTER",
@@ -407,7 +830,7 @@ class TestByBitClient:
         initialized_client.configs["MASTER"] = MagicMock()
         initialized_client.configs["MASTER"].is_read_only = False
         
-        with patch.object(trading_config, 'trading_mode', 'live'):
+        with patch.object(initialized_client, '_paper', False):
             result = await initialized_client.cancel_order(
                 subaccount="MASTER",
                 order_id="order123",
@@ -422,7 +845,7 @@ class TestByBitClient:
         mock_exchange = initialized_client.exchanges["MASTER"]
         mock_exchange.fetch_order = AsyncMock(return_value={'status': 'closed'})
         
-        with patch.object(trading_config, 'trading_mode', 'live'):
+        with patch.object(initialized_client, '_paper', False):
             status = await initialized_client.get_order_status(
                 subaccount="MASTER",
                 order_id="order123",
@@ -437,7 +860,7 @@ class TestByBitClient:
         mock_exchange = initialized_client.exchanges["MASTER"]
         mock_exchange.fetch_order = AsyncMock(side_effect=ccxt.OrderNotFound)
         
-        with patch.object(trading_config, 'trading_mode', 'live'):
+        with patch.object(initialized_client, '_paper', False):
             status = await initialized_client.get_order_status(
                 subaccount="MASTER",
                 order_id="order123",
@@ -446,6 +869,21 @@ class TestByBitClient:
         
         assert status == OrderStatus.CANCELLED
     
+    @pytest.mark.asyncio
+    async def test_paper_order_queries_skip_exchange(self, client):
+        """Test paper-mode order queries answer without the retry path."""
+        client._fetch_order_status = AsyncMock()
+        client._fetch_open_orders = AsyncMock()
+        
+        with patch.object(client, '_paper', True):
+            status = await client.get_order_status("MASTER", "order123", "BTCUSDT")
+            orders = await client.get_open_orders("MASTER")
+        
+        assert status == OrderStatus.FILLED
+        assert orders == []
+        client._fetch_order_status.assert_not_awaited()
+        client._fetch_open_orders.assert_not_awaited()
+    
     @pytest.mark.asyncio
     async def test_get_open_orders(self, initialized_client):
         """Test getting open orders."""
@@ -462,7 +900,7 @@ class TestByBitClient:
             'average': None
         }])
         
-        with patch.object(trading_config, 'trading_mode', 'live'):
+        with patch.object(initialized_client, '_paper', False):
             orders = await initialized_client.get_open_orders("MASTER")
         
         assert len(orders) == 1
@@ -543,6 +981,572 @@ class TestByBitClient:
         
         assert "MASTER" in balances
         assert isinstance(balances["MASTER"], Portfolio)
+    
+    @pytest.mark.asyncio
+    async def test_snapshot_fetches_balance_and_positions_together(self, client):
+        """Test snapshot overlaps the balance and positions requests."""
+        in_flight = 0
+        peak = 0
+        
+        async def tracked(result):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return result
+        
+        portfolio = MagicMock()
+        client.get_balance = lambda subaccount, asset: tracked(portfolio)
+        client.get_positions = lambda subaccount: tracked([])
+        
+        assert await client.snapshot("TREND") == (portfolio, [])
+        assert peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_balance_safe_lets_cancellation_through(self, client):
+        """Test failed balances become None but cancellation propagates."""
+        client.get_balance = AsyncMock(side_effect=ccxt.ExchangeError("down"))
+        assert await client._get_balance_safe("MASTER") is None
+        
+        client.get_balance = AsyncMock(side_effect=asyncio.CancelledError)
+        with pytest.raises(asyncio.CancelledError):
+            await client._get_balance_safe("MASTER")
+    
+    @pytest.mark.asyncio
+    async def test_get_tickers_batch(self, client):
+        """Test batched tickers keep order and per-symbol failures."""
+        exchange = AsyncMock()
+        
+        async def fake_fetch_ticker(symbol):
+            if symbol == "BADUSDT":
+                raise ccxt.BadSymbol("unknown symbol")
+            return {"last": 100, "bid": 99, "ask": 101, "timestamp": 1}
+        
+        exchange.fetch_ticker = fake_fetch_ticker
+        client.exchanges["MASTER"] = exchange
+        
+        results = await client.get_tickers_batch(["BTCUSDT", "BADUSDT"])
+        
+        assert results[0]["symbol"] == "BTCUSDT"
+        assert results[0]["last"] == Decimal("100")
+        assert isinstance(results[1], ccxt.BadSymbol)
+    
+    @pytest.mark.asyncio
+    async def test_get_tickers_single_request(self, client):
+        """Test several tickers come from one fetch_tickers call."""
+        exchange = AsyncMock()
+        exchange.fetch_tickers.return_value = {
+            "BTC/USDT": {"last": 50000, "bid": 49999, "ask": 50001, "timestamp": 1},
+            "ETH/USDT": {"last": 3000, "bid": 2999, "ask": 3001, "timestamp": 1},
+        }
+        client.exchanges["MASTER"] = exchange
+        
+        tickers = await client.get_tickers(["BTCUSDT", "ETHUSDT", "XYZUSDT"])
+        
+        exchange.fetch_tickers.assert_awaited_once_with(
+            ["BTC/USDT", "ETH/USDT", "XYZ/USDT"]
+        )
+        exchange.fetch_ticker.assert_not_called()
+        assert sorted(tickers) == ["BTCUSDT", "ETHUSDT"]
+        assert tickers["ETHUSDT"]["last"] == Decimal("3000")
+    
+    @pytest.mark.asyncio
+    async def test_batch_calls_bounded_by_semaphore(self, client, monkeypatch):
+        """Test batch fan-out never exceeds max_concurrent_requests."""
+        from src.core import config as config_module
+        monkeypatch.setattr(
+            config_module.engine_config.bybit, "max_concurrent_requests", 2
+        )
+        in_flight = 0
+        peak = 0
+        
+        async def fake_fetch_ticker(symbol):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"last": 100, "bid": 99, "ask": 101, "timestamp": 1}
+        
+        exchange = AsyncMock()
+        exchange.fetch_ticker = fake_fetch_ticker
+        client.exchanges["MASTER"] = exchange
+        
+        results = await client.get_tickers_batch(["A", "B", "C", "D", "E"])
+        
+        assert len(results) == 5
+        assert peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_get_order_statuses(self, client):
+        """Test batched order statuses keep order and per-order failures."""
+        exchange = AsyncMock()
+        exchange.fetch_order = AsyncMock(side_effect=[
+            {"status": "closed"}, ccxt.OrderNotFound("gone"),
+        ])
+        client.exchanges["TREND"] = exchange
+        
+        with patch.object(client, '_paper', False):
+            statuses = await client.get_order_statuses(
+                "TREND", [("1", "BTCUSDT"), ("2", "ETHUSDT")]
+            )
+        
+        assert statuses == [OrderStatus.FILLED, OrderStatus.CANCELLED]
+    
+    @pytest.mark.asyncio
+    async def test_create_orders_batch(self, client):
+        """Test batch orders are chunked per request and rejections kept per order."""
+        exchange = AsyncMock()
+        exchange.create_orders = AsyncMock(side_effect=lambda orders: [
+            {"id": str(i), "status": "open", "info": {"code": 0}}
+            for i in range(len(orders))
+        ])
+        client.exchanges["TREND"] = exchange
+        client.configs["TREND"] = SubAccountConfig.from_profile(
+            SubAccountType.TREND, "key", "secret"
+        )
+        client.configs["TREND"].default_market = "linear"
+        specs = [
+            {"symbol": "BTCUSDT", "side": "buy", "order_type": "limit",
+             "amount": Decimal("0.01"), "price": Decimal("50000")}
+            for _ in range(25)
+        ]
+        specs.append({"symbol": "BTCUSDT", "side": "buy", "order_type": "limit",
+                      "amount": Decimal("0.01")})
+        
+        with patch.object(client, '_paper', False):
+            results = await client.create_orders_batch("TREND", specs)
+        
+        assert exchange.create_orders.await_count == 2
+        assert [len(c.args[0]) for c in exchange.create_orders.await_args_list] == [20, 5]
+        sent = exchange.create_orders.await_args_list[0].args[0][0]
+        assert (sent["amount"], sent["price"]) == ("0.01", "50000")
+        assert all(isinstance(r, Order) for r in results[:25])
+        assert isinstance(results[25], ValueError)
+        
+        exchange.create_orders = AsyncMock(return_value=[
+            {"id": None, "info": {"code": "170131", "msg": "Insufficient balance"}}
+        ])
+        with patch.object(client, '_paper', False):
+            results = await client.create_orders_batch("TREND", specs[:1])
+        
+        assert isinstance(results[0], ccxt.InvalidOrder)
+
+    @pytest.mark.asyncio
+    async def test_create_order_drops_mark_price_for_ccxt(self, client):
+        """Test the demo-only mark_price hint never reaches ccxt."""
+        exchange = AsyncMock()
+        exchange.create_order = AsyncMock(
+            return_value={"id": "1", "status": "open", "filled": 0}
+        )
+        client.exchanges["TREND"] = exchange
+        client.configs["TREND"] = SubAccountConfig.from_profile(
+            SubAccountType.TREND, "key", "secret"
+        )
+        params = {"mark_price": "60000", "reduceOnly": False}
+
+        with patch.object(client, '_paper', False):
+            await client.create_order(
+                "TREND", "BTCUSDT", "buy", "market", Decimal("0.01"), params=params
+            )
+
+        sent = exchange.create_order.await_args.kwargs["params"]
+        assert "mark_price" not in sent
+        assert sent["reduceOnly"] is False
+        assert params["mark_price"] == "60000"
+
+    @pytest.mark.asyncio
+    async def test_get_all_balances_fetches_concurrently(self, client):
+        """Test subaccount balances are requested at the same time."""
+        client.exchanges = {"MASTER": AsyncMock(), "TREND": AsyncMock()}
+        in_flight = 0
+        peak = 0
+        
+        async def fake_balance(subaccount):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if subaccount == "TREND":
+                raise ccxt.NetworkError("down")
+            return MagicMock(spec=Portfolio)
+        
+        with patch.object(client, "get_balance", side_effect=fake_balance):
+            balances = await client.get_all_balances()
+        
+        assert peak == 2
+        assert balances["TREND"] is None
+        assert balances["MASTER"] is not None
+
+
+# =============================================================================
+# PybitDemoClient Tests
+# =============================================================================
+
+class TestPybitDemoClient:
+    """Test PybitDemoClient wrapper."""
+    
+    @pytest.fixture
+    def demo_client(self):
+        """Create a PybitDemoClient with the demo HTTP session mocked out."""
+        client = PybitDemoClient(api_key="key", api_secret="secret")
+        client._client = AsyncMock()
+        client._client.place_order.return_value = {
+            "retCode": 0, "result": {"orderId": "demo-1"}
+        }
+        # No markets load unless a test opts in
+        client._precision_loaded = True
+        return client
+    
+    def test_convert_balance(self, demo_client):
+        """Test pybit wallet balance is converted to ccxt-like totals."""
+        result = {
+            "retCode": 0,
+            "result": {"list": [{"coin": [
+                {"coin": "USDT", "walletBalance": "100", "availableToWithdraw": "60"},
+                {"coin": "BTC", "walletBalance": "0.5", "availableToWithdraw": ""},
+                {"coin": "ETH", "walletBalance": "0", "availableToWithdraw": "0"},
+                {"coin": "BAD", "walletBalance": "n/a"},
+                {"coin": "", "walletBalance": "1"},
+            ]}]},
+        }
+        
+        balances = demo_client._convert_balance(result)
+        
+        assert balances["total"] == {"USDT": 100.0, "BTC": 0.5}
+        assert balances["free"] == {"USDT": 60.0, "BTC": 0.5}
+        assert balances["used"] == {"USDT": 40.0, "BTC": 0.0}
+        assert balances["info"] is result
+    
+    @pytest.mark.asyncio
+    async def test_fetch_balance_shared_across_clients(self, demo_client):
+        """Test clients with the same API key share one wallet request."""
+        demo_client._client.get_wallet_balance.return_value = {
+            "retCode": 0,
+            "result": {"list": [{"coin": [{"coin": "USDT", "walletBalance": "10"}]}]},
+        }
+        other = PybitDemoClient(
+            api_key="key", api_secret="secret",
+            balance_cache=demo_client._balance_cache,
+        )
+        other._client = demo_client._client
+        
+        first, second = await asyncio.gather(
+            demo_client.fetch_balance(), other.fetch_balance()
+        )
+        
+        assert first["total"] == {"USDT": 10.0}
+        assert second is first
+        demo_client._client.get_wallet_balance.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_fetch_balance_cache_not_shared_between_owners(self, demo_client):
+        """Test standalone clients keep their own wallet cache and locks."""
+        demo_client._client.get_wallet_balance.return_value = {
+            "retCode": 0, "result": {"list": []}
+        }
+        other = PybitDemoClient(api_key="key", api_secret="secret")
+        other._client = demo_client._client
+
+        await demo_client.fetch_balance()
+        await other.fetch_balance()
+
+        assert demo_client._client.get_wallet_balance.call_count == 2
+        cache = demo_client._balance_cache
+        assert cache is not other._balance_cache
+        assert cache.lock("key") is cache.lock("key")
+
+    @pytest.mark.asyncio
+    async def test_fetch_balance_refetches_after_order(self, demo_client):
+        """Test a placed order invalidates the cached wallet balance."""
+        demo_client._client.get_wallet_balance.return_value = {
+            "retCode": 0, "result": {"list": []}
+        }
+        
+        await demo_client.fetch_balance()
+        await demo_client.create_order(
+            symbol="ETHUSDT", side="sell", order_type="market", amount="1"
+        )
+        await demo_client.fetch_balance()
+        
+        assert demo_client._client.get_wallet_balance.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_fetch_ohlcv_reuses_recent_window(self, demo_client):
+        """Test repeated OHLCV requests within half a bar hit the cache."""
+        market = MagicMock()
+        market.fetch_ohlcv = AsyncMock(return_value=[[1, 2, 3, 1, 2, 10]])
+        demo_client._market_exchange = market
+        
+        first = await demo_client.fetch_ohlcv("BTCUSDT", "1h", limit=50)
+        second = await demo_client.fetch_ohlcv("BTCUSDT", "1h", limit=50)
+        await demo_client.fetch_ohlcv("BTCUSDT", "1h", limit=51)
+        
+        assert second is first
+        assert market.fetch_ohlcv.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_fetch_ohlcv_refetches_expired_window(self, demo_client, monkeypatch):
+        """Test cached OHLCV expires after half the bar duration."""
+        market = MagicMock()
+        market.fetch_ohlcv = AsyncMock(return_value=[[1, 2, 3, 1, 2, 10]])
+        demo_client._market_exchange = market
+        now = [1000.0]
+        monkeypatch.setattr(bybit_client.time, "monotonic", lambda: now[0])
+        
+        await demo_client.fetch_ohlcv("BTCUSDT", "1m", limit=50)
+        now[0] += 31
+        await demo_client.fetch_ohlcv("BTCUSDT", "1m", limit=50)
+        
+        assert market.fetch_ohlcv.call_count == 2
+    
+    def test_map_order_status(self, demo_client):
+        """Test Bybit order statuses map to ccxt statuses."""
+        assert demo_client._map_order_status("New") == "open"
+        assert demo_client._map_order_status("Filled") == "closed"
+        assert demo_client._map_order_status("Cancelled") == "canceled"
+        assert demo_client._map_order_status("Bogus") == "unknown"
+    
+    @pytest.mark.asyncio
+    async def test_market_exchange_uses_pooled_session(self, demo_client):
+        """Test market data shares one pooled session that close() releases."""
+        exchange = demo_client._get_market_exchange()
+        session = demo_client._market_session
+        
+        assert exchange.session is session
+        assert session.connector.limit == PybitDemoClient.MARKET_DATA_POOL_SIZE
+        assert exchange.parse_json('{"retCode": 0}') == {"retCode": 0}
+        assert exchange.parse_json("<html>") is None
+        
+        await demo_client.close()
+
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_close_fails_orders_waiting_for_batch(self, demo_client):
+        """Test close() cancels the batch flush and fails queued orders."""
+        order = asyncio.create_task(
+            demo_client._place_order({"category": "spot", "symbol": "BTCUSDT"})
+        )
+        await asyncio.sleep(0)
+        assert len(demo_client._flush_tasks) == 1
+
+        await demo_client.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            await order
+        assert not demo_client._flush_tasks
+        demo_client._client.place_order.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_order_uses_cached_precision(self, demo_client, monkeypatch):
+        """Test quantity is quantized with the step loaded from market metadata."""
+        monkeypatch.setitem(
+            bybit_client._PRECISION_CACHE, ("spot", "SOLUSDT"), Decimal("0.01")
+        )
+        
+        await demo_client.create_order(
+            symbol="SOLUSDT", side="sell", order_type="market", amount=1.23456
+        )
+        
+        params = demo_client._client.place_order.call_args.kwargs
+        assert params["qty"] == "1.23"
+    
+    @pytest.mark.asyncio
+    async def test_create_order_loads_precision_once(self, demo_client, monkeypatch):
+        """Test the first qty order loads per-category steps from markets."""
+        monkeypatch.setattr(bybit_client, "_PRECISION_CACHE", {})
+        market = MagicMock()
+        market.load_markets = AsyncMock(return_value={
+            "SOL/USDT": {
+                "id": "SOLUSDT", "spot": True, "precision": {"amount": 0.01},
+            },
+            "SOL/USDT:USDT": {
+                "id": "SOLUSDT", "spot": False, "linear": True,
+                "precision": {"amount": 0.1},
+            },
+        })
+        demo_client._market_exchange = market
+        demo_client._precision_loaded = False
+
+        await demo_client.create_order(
+            symbol="SOLUSDT", side="sell", order_type="market", amount=1.23456
+        )
+        spot_qty = demo_client._client.place_order.call_args.kwargs["qty"]
+        await demo_client.create_order(
+            symbol="SOLUSDT", side="sell", order_type="market", amount=1.23456,
+            params={"market_type": "linear"},
+        )
+        linear_qty = demo_client._client.place_order.call_args.kwargs["qty"]
+
+        assert spot_qty == "1.23"
+        assert linear_qty == "1.2"
+        market.load_markets.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_create_order_market_buy_uses_raw_ticker_price(self, demo_client):
+        """Test market buys convert to a quote amount from Bybit's raw price string."""
+        demo_client.fetch_ticker = AsyncMock(
+            return_value={"last": 50000.0, "info": {"lastPrice": "50000.5"}}
+        )
+        
+        await demo_client.create_order(
+            symbol="BTCUSDT", side="buy", order_type="market", amount="0.001"
+        )
+        
+        params = demo_client._client.place_order.call_args.kwargs
+        assert params["marketUnit"] == "quoteCoin"
+        assert params["qty"] == "50.00"
+    
+    @pytest.mark.asyncio
+    async def test_create_order_market_buy_uses_mark_price_hint(self, demo_client):
+        """Test a mark_price hint sizes market buys without fetching a ticker."""
+        demo_client.fetch_ticker = AsyncMock()
+        
+        await demo_client.create_order(
+            symbol="BTCUSDT", side="buy", order_type="market", amount="0.001",
+            params={"mark_price": "60000"},
+        )
+        
+        params = demo_client._client.place_order.call_args.kwargs
+        assert params["qty"] == "60.00"
+        demo_client.fetch_ticker.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_create_order_falls_back_to_default_precision(self, demo_client):
+        """Test unknown symbols fall back to the built-in BTC/ETH/default steps."""
+        await demo_client.create_order(
+            symbol="ETHUSDT", side="sell", order_type="market", amount=1.2345678
+        )
+        
+        params = demo_client._client.place_order.call_args.kwargs
+        assert params["qty"] == "1.23457"
+    
+    @pytest.mark.asyncio
+    async def test_create_order_over_websocket(self, demo_client):
+        """Test orders go over the WebSocket trade stream when enabled."""
+        ws_trading = MagicMock()
+        ws_trading.is_connected.return_value = True
+        ws_trading.place_order.side_effect = lambda callback, error_callback, **kw: (
+            callback({"retCode": 0, "retMsg": "OK", "data": {"orderId": "ws-1"}})
+        )
+        demo_client._use_ws_orders = True
+        demo_client._ws_trading = ws_trading
+        
+        order = await demo_client.create_order(
+            symbol="ETHUSDT", side="sell", order_type="market", amount="1"
+        )
+        
+        assert order.exchange_order_id == "ws-1"
+        assert ws_trading.place_order.call_args.kwargs["symbol"] == "ETHUSDT"
+        demo_client._client.place_order.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_create_order_falls_back_to_http_when_websocket_fails(self, demo_client):
+        """Test a failed WebSocket send falls back to the HTTP endpoint."""
+        ws_trading = MagicMock()
+        ws_trading.is_connected.return_value = True
+        ws_trading.place_order.side_effect = ConnectionError("socket closed")
+        demo_client._use_ws_orders = True
+        demo_client._ws_trading = ws_trading
+        
+        order = await demo_client.create_order(
+            symbol="ETHUSDT", side="sell", order_type="market", amount="1"
+        )
+        
+        assert order.exchange_order_id == "demo-1"
+        demo_client._client.place_order.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_orders_share_one_batch_request(self, demo_client):
+        """Test orders submitted within the batch window go out as one request."""
+        demo_client._client.place_batch_order.return_value = {
+            "retCode": 0,
+            "result": {"list": [{"orderId": "b-1"}, {"orderId": ""}]},
+            "retExtInfo": {"list": [
+                {"code": 0, "msg": "OK"},
+                {"code": 170131, "msg": "Insufficient balance."},
+            ]},
+        }
+        
+        results = await asyncio.gather(
+            demo_client.create_order(
+                symbol="ETHUSDT", side="sell", order_type="market", amount="1"
+            ),
+            demo_client.create_order(
+                symbol="BTCUSDT", side="sell", order_type="market", amount="1"
+            ),
+            return_exceptions=True,
+        )
+        
+        assert results[0].exchange_order_id == "b-1"
+        assert "Insufficient balance" in str(results[1])
+        kwargs = demo_client._client.place_batch_order.call_args.kwargs
+        assert kwargs["category"] == "spot"
+        assert [r["symbol"] for r in kwargs["request"]] == ["ETHUSDT", "BTCUSDT"]
+        assert "category" not in kwargs["request"][0]
+        demo_client._client.place_order.assert_not_called()
+
+
+# =============================================================================
+# BybitDemoAsyncHTTP Tests
+# =============================================================================
+
+class TestBybitDemoAsyncHTTP:
+    """Test the native asyncio demo HTTP client."""
+    
+    @pytest.fixture
+    def http_client(self):
+        """Create a BybitDemoAsyncHTTP with a mocked aiohttp session."""
+        response = MagicMock()
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=False)
+        response.json = AsyncMock(return_value={"retCode": 0, "result": {}})
+        
+        client = BybitDemoAsyncHTTP(api_key="key", api_secret="secret")
+        client._session = MagicMock(closed=False)
+        client._session.get = AsyncMock(return_value=response)
+        client._session.post = AsyncMock(return_value=response)
+        return client
+    
+    def test_sign_request_matches_pybit(self):
+        """Test signatures match pybit's HMAC implementation."""
+        from pybit._http_manager import generate_signature
+        
+        payload = '{"symbol": "BTCUSDT"}'
+        expected = generate_signature(
+            False, "secret", "1700000000000key10000" + payload
+        )
+        
+        assert sign_request("key", "secret", 1700000000000, 10000, payload) == expected
+    
+    @pytest.mark.asyncio
+    async def test_get_sends_sorted_query(self, http_client):
+        """Test GET requests sign and send the sorted query without None values."""
+        await http_client.get_order_history(
+            symbol="BTCUSDT", category="spot", orderId=None
+        )
+        
+        url = http_client._session.get.call_args.args[0]
+        headers = http_client._session.get.call_args.kwargs["headers"]
+        assert url.endswith("/v5/order/history?category=spot&symbol=BTCUSDT")
+        assert headers["X-BAPI-API-KEY"] == "key"
+        assert headers["X-BAPI-RECV-WINDOW"] == "10000"
+    
+    @pytest.mark.asyncio
+    async def test_post_sends_signed_json_body(self, http_client):
+        """Test POST requests sign the exact JSON body that is sent."""
+        result = await http_client.place_order(category="spot", symbol="BTCUSDT")
+        
+        kwargs = http_client._session.post.call_args.kwargs
+        headers = kwargs["headers"]
+        assert kwargs["data"] == '{"category": "spot", "symbol": "BTCUSDT"}'
+        assert headers["X-BAPI-SIGN"] == sign_request(
+            "key", "secret", int(headers["X-BAPI-TIMESTAMP"]), 10000, kwargs["data"]
+        )
+        assert result == {"retCode": 0, "result": {}}
 
 
 # =============================================================================
@@ -630,6 +1634,74 @@ class TestRetryDecorator:
         assert result == "success"
         assert call_count == 2
 
+    def test_retry_after_from_headers(self):
+        """Test Retry-After and Bybit reset headers are turned into waits."""
+        assert bybit_client._retry_after_from_headers({"Retry-After": "2"}) == 2.0
+        reset_ms = int((bybit_client.time.time() + 5) * 1000)
+        wait = bybit_client._retry_after_from_headers(
+            {"X-Bapi-Limit-Reset-Timestamp": str(reset_ms)}
+        )
+        assert 4.0 < wait <= 5.0
+        assert bybit_client._retry_after_from_headers({}) is None
+        assert bybit_client._retry_after_from_headers(None) is None
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_waits_for_exchange_reset(self):
+        """Test rate limits sleep until the reset the exchange reported."""
+        exchange = ccxt.bybit()
+        exchange.last_response_headers = {"Retry-After": "0.02"}
+        call_count = 0
+
+        @with_retry(max_retries=2, base_delay=5.0)
+        async def rate_limited(exchange):
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
+                raise ccxt.RateLimitExceeded("Rate limit")
+            return "success"
+
+        with patch.object(bybit_client.asyncio, "sleep", new=AsyncMock()) as sleep:
+            result = await rate_limited(exchange)
+        await exchange.close()
+
+        assert result == "success"
+        sleep.assert_awaited_once_with(0.02)
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_ignores_stale_reset_header(self):
+        """Test a reset already in the past falls back to normal backoff."""
+        client = ByBitClient()
+        stale = ccxt.bybit()
+        stale.last_response_headers = {
+            "X-Bapi-Limit-Reset-Timestamp": str(
+                int((bybit_client.time.time() - 5) * 1000)
+            )
+        }
+        # Another subaccount's fresh header must not be used either
+        other = ccxt.bybit()
+        other.last_response_headers = {"Retry-After": "30"}
+        client.exchanges = {"TREND": stale, "CORE_HODL": other}
+        call_count = 0
+
+        @with_retry(max_retries=2, base_delay=0.5)
+        async def rate_limited(self, subaccount):
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
+                raise ccxt.RateLimitExceeded("Rate limit")
+            return "success"
+
+        with patch.object(bybit_client.asyncio, "sleep", new=AsyncMock()) as sleep:
+            result = await rate_limited(client, "TREND")
+        await stale.close()
+        await other.close()
+
+        assert result == "success"
+        sleep.assert_awaited_once_with(0.5)
+        assert bybit_client._retry_after_from_headers(
+            stale.last_response_headers
+        ) is None
+
 
 # =============================================================================
 # Error Handling Tests
@@ -660,7 +1732,7 @@ class TestErrorHandling:
                 client.configs["MASTER"] = MagicMock()
                 client.configs["MASTER"].is_read_only = False
                 
-                with patch.object(trading_config, 'trading_mode', 'live'):
+                with patch.object(client, '_paper', False):
                     with pytest.raises(ccxt.InsufficientFunds):
                         await client.create_order(
                             subaccount="MASTER",
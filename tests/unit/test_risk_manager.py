@@ -82,6 +82,19 @@ class TestRiskManagerInitialization:
         assert risk_manager.DEFAULT_RISK_PER_TRADE == Decimal("0.01")
         assert risk_manager.CORRELATION_CRISIS_THRESHOLD == Decimal("0.90")
         assert risk_manager.MIN_SIGNAL_CONFIDENCE == Decimal("0.60")
+    
+    def test_reload_config_picks_up_new_limits(self, risk_manager, monkeypatch):
+        """Test limits are bound at construction and refreshed by reload_config."""
+        monkeypatch.setattr(trading_config, "max_concurrent_positions", 7)
+        monkeypatch.setattr(trading_config, "max_daily_loss_pct", 0.03)
+        
+        assert risk_manager._max_concurrent_positions != 7
+        
+        risk_manager.reload_config()
+        
+        assert risk_manager._max_concurrent_positions == 7
+        assert risk_manager._max_daily_loss_pct == Decimal("3.00")
+        assert risk_manager._daily_loss_warning_pct == Decimal("2.400")
 
 
 # =============================================================================
@@ -162,6 +175,26 @@ class TestSignalValidation:
         # Check that it's rejected for duplicate position or max position
         assert "already have" in check.reason.lower() or "duplicate" in check.reason.lower() or "position" in check.reason.lower()
 
+    @pytest.mark.asyncio
+    async def test_cheap_rules_reject_before_position_size(self, risk_manager, portfolio, sample_signal):
+        """Test that duplicate check runs before the position size math."""
+        await risk_manager.initialize(portfolio)
+
+        # Oversized LONG in the same symbol fails both rules
+        positions = {
+            "BTCUSDT": Position(
+                symbol="BTCUSDT",
+                side=PositionSide.LONG,
+                entry_price=Decimal("50000"),
+                amount=Decimal("1")
+            )
+        }
+
+        check = risk_manager.check_signal(sample_signal, portfolio, positions)
+
+        assert not check.passed
+        assert check.rule_triggered == "duplicate_position"
+
 
 # =============================================================================
 # Daily/Weekly Loss Limit Tests